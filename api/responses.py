@@ -0,0 +1,72 @@
+"""
+Shared JSON response helpers built on orjson
+"""
+
+import hashlib
+from typing import Any, Optional
+
+import orjson
+from fastapi.responses import ORJSONResponse, Response
+
+# Non-string dict keys (e.g. ints) are common in node outputs; numpy arrays can
+# come back from embedding/vector code paths
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def orjson_default(obj: Any) -> Any:
+    """
+    Fallback for types orjson does not serialize natively.
+
+    datetime, date, UUID, dataclasses and numpy arrays are handled by orjson
+    itself; sets become lists and anything else its string form.
+
+    Args:
+        obj: Object orjson could not serialize
+
+    Returns:
+        JSON-serializable replacement
+    """
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    return str(obj)
+
+
+def dumps_json(content: Any) -> bytes:
+    """Serialize content to JSON bytes with the app-wide orjson settings"""
+    return orjson.dumps(content, default=orjson_default, option=ORJSON_OPTIONS)
+
+
+class AppJSONResponse(ORJSONResponse):
+    """ORJSONResponse that tolerates sets and other non-native types in payloads"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps_json(content)
+
+
+def make_etag(body: bytes) -> str:
+    """Weak ETag derived from a response body"""
+    return f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_response(body: bytes, if_none_match: Optional[str], cache_control: str,
+                  etag: Optional[str] = None) -> Response:
+    """
+    Build a JSON response carrying an ETag, or a 304 if the client already has it.
+
+    Args:
+        body: Encoded JSON body
+        if_none_match: Value of the request's If-None-Match header, if any
+        cache_control: Cache-Control header value to send
+        etag: Precomputed ETag for body (computed from body if omitted)
+
+    Returns:
+        304 Not Modified when If-None-Match matches, else a 200 with body
+    """
+    etag = etag or make_etag(body)
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if if_none_match:
+        candidates = {tag.strip() for tag in if_none_match.split(",")}
+        # Weak comparison: W/ prefixes are ignored on either side
+        if "*" in candidates or etag[2:] in {tag.removeprefix("W/") for tag in candidates}:
+            return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -3,38 +3,147 @@ Credentials API endpoints - Manage .env credential entries
 """
 
 from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 from pathlib import Path
-from dotenv import set_key, load_dotenv
+from dotenv import set_key, dotenv_values
+import mmap
 import os
+import threading
+
+try:
+    from language_model_services.openai_service.openai_service import OpenAIService
+except ImportError:
+    OpenAIService = None
+try:
+    from language_model_services.groq_service.groq_service import GroqService
+except ImportError:
+    GroqService = None
 
 
 router = APIRouter(prefix="/credentials", tags=["credentials"])
 
+# Parsed .env contents keyed by path, tagged with the file's mtime at parse time
+_ENV_CACHE: Dict[Path, Tuple[int, Dict[str, Optional[str]]]] = {}
+# File edits run in the threadpool; serialize them so concurrent requests don't interleave
+_ENV_WRITE_LOCK = threading.Lock()
+
+
+def _load_env_cached(env_path: Path) -> Dict[str, Optional[str]]:
+    """
+    Return the parsed key-values of a .env file, re-parsing only when its mtime changes.
+    """
+    mtime_ns = env_path.stat().st_mtime_ns
+    cached = _ENV_CACHE.get(env_path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    values = dotenv_values(env_path)
+    _ENV_CACHE[env_path] = (mtime_ns, values)
+    return values
+
+
+def _remove_env_key(env_path: Path, key: str) -> None:
+    """
+    Remove every `key=` line from the .env file in place.
+
+    Matching lines are cut out of a memory map and the tail shifted down, so the
+    file is never split into a list of lines. Windows keeps the read/rewrite path.
+    """
+    if os.name == "nt":
+        lines = env_path.read_text(encoding="utf-8").splitlines()
+        key_prefix = f"{key}="
+        new_lines = [line for line in lines if not line.strip().startswith(key_prefix)]
+        env_path.write_text("\n".join(new_lines) + ("\n" if new_lines else ""), encoding="utf-8")
+        return
+
+    key_prefix = f"{key}=".encode("utf-8")
+    fd = os.open(env_path, os.O_RDWR)
+    try:
+        size = os.fstat(fd).st_size
+        if size == 0:
+            return
+        with mmap.mmap(fd, 0) as mm:
+            pos = mm.find(key_prefix, 0, size)
+            while pos != -1:
+                line_start = mm.rfind(b"\n", 0, pos) + 1
+                if mm[line_start:pos].strip():
+                    # Prefix found mid-line (e.g. inside another key or value)
+                    pos = mm.find(key_prefix, pos + 1, size)
+                    continue
+                line_end = mm.find(b"\n", pos, size)
+                line_end = size if line_end == -1 else line_end + 1
+                mm.move(line_start, line_end, size - line_end)
+                size -= line_end - line_start
+                pos = mm.find(key_prefix, line_start, size)
+        os.ftruncate(fd, size)
+    finally:
+        os.close(fd)
+
+
+def _apply_env(values: Dict[str, Optional[str]]) -> None:
+    """Copy parsed .env values into the current process environment."""
+    for key, value in values.items():
+        if value is not None:
+            os.environ[key] = value
+
+
+def _reload_service_credentials() -> None:
+    """Let already-created language model services pick up changed API keys."""
+    for service_class in (OpenAIService, GroqService):
+        if service_class is not None and service_class._instance is not None:
+            service_class._instance.reload_credentials()
+
+
+def _save_credential(env_path: Path, key: str, value: str) -> None:
+    """Write a key to the .env file and reload it into the process environment."""
+    with _ENV_WRITE_LOCK:
+        env_path.touch(exist_ok=True)
+        set_key(str(env_path), key, value)
+        _ENV_CACHE.pop(env_path, None)
+
+    # Reload environment variables to make them available immediately
+    _apply_env(_load_env_cached(env_path))
+
+    # Update the current process environment
+    os.environ[key] = value
+    _reload_service_credentials()
+
+
+def _delete_credential(env_path: Path, key: str) -> None:
+    """Remove a key from the .env file and the process environment."""
+    with _ENV_WRITE_LOCK:
+        env_path.touch(exist_ok=True)
+        _remove_env_key(env_path, key)
+        _ENV_CACHE.pop(env_path, None)
+
+    # Remove from current process environment
+    os.environ.pop(key, None)
+    _reload_service_credentials()
+
+
+def _refresh_from_env_file(env_path: Path) -> bool:
+    """Reload the .env file into the process environment; False if there is no file."""
+    if not env_path.exists():
+        return False
+    _apply_env(_load_env_cached(env_path))
+    _reload_service_credentials()
+    return True
+
 
 class CredentialPayload(BaseModel):
     key: str = Field(..., min_length=1, description="Environment variable key")
     value: str = Field(..., description="Environment variable value")
 
 
-@router.post("/set", response_model=Dict[str, Any])
+@router.post("/set")
 async def set_credential(payload: CredentialPayload):
     """
     Create or update a key-value in the backend .env file and reload environment variables.
     """
     try:
-        env_path = Path(".") / ".env"
-        env_path.touch(exist_ok=True)
-        load_dotenv(env_path)  # ensure loaded/created
-
-        set_key(str(env_path), payload.key, payload.value)
-        
-        # Reload environment variables to make them available immediately
-        load_dotenv(env_path, override=True)
-        
-        # Update the current process environment
-        os.environ[payload.key] = payload.value
+        await run_in_threadpool(_save_credential, Path(".") / ".env", payload.key, payload.value)
 
         return {
             "success": True,
@@ -51,24 +160,13 @@ class DeletePayload(BaseModel):
     key: str = Field(..., min_length=1, description="Environment variable key to remove")
 
 
-@router.post("/delete", response_model=Dict[str, Any])
+@router.post("/delete")
 async def delete_credential(payload: DeletePayload):
     """
     Remove a key from the backend .env file by rewriting it without the key.
     """
     try:
-        env_path = Path(".") / ".env"
-        env_path.touch(exist_ok=True)
-
-        # Read all lines and filter out the key
-        lines = env_path.read_text(encoding="utf-8").splitlines()
-        key_prefix = f"{payload.key}="
-        new_lines = [line for line in lines if not line.strip().startswith(key_prefix)]
-        env_path.write_text("\n".join(new_lines) + ("\n" if new_lines else ""), encoding="utf-8")
-        
-        # Remove from current process environment
-        if payload.key in os.environ:
-            del os.environ[payload.key]
+        await run_in_threadpool(_delete_credential, Path(".") / ".env", payload.key)
 
         return {
             "success": True,
@@ -81,15 +179,13 @@ async def delete_credential(payload: DeletePayload):
         raise HTTPException(status_code=500, detail=f"Failed to delete credential: {str(e)}")
 
 
-@router.post("/refresh", response_model=Dict[str, Any])
+@router.post("/refresh")
 async def refresh_environment():
     """
     Reload all environment variables from the .env file without restarting the server.
     """
     try:
-        env_path = Path(".") / ".env"
-        if env_path.exists():
-            load_dotenv(env_path, override=True)
+        if await run_in_threadpool(_refresh_from_env_file, Path(".") / ".env"):
             return {
                 "success": True,
                 "data": {
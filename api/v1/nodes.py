@@ -2,27 +2,183 @@
 Nodes API endpoints - Handle all node-related operations
 """
 
-from fastapi import APIRouter, HTTPException
-from typing import List, Dict, Any, Set
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import Response, StreamingResponse
+from typing import AsyncIterator, Callable, FrozenSet, List, Dict, Any, Optional, Set, Tuple
+from array import array
+from collections import OrderedDict
+from functools import lru_cache
+import asyncio
+import hashlib
+import heapq
+import logging
+import time
 import traceback
-import sys
+import weakref
+import orjson
 import os
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
-
-# Add the project root to the path
-project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-sys.path.insert(0, project_root)
+from prometheus_client import Counter, Histogram
 
+from api.responses import dumps_json
 from nodes.node_registry import node_registry
 from language_model_services.openai_service.openai_service import OpenAIService
 from language_model_services.groq_service.groq_service import GroqService
 from language_model_services.ollama_service.ollama_service import OllamaService
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/nodes", tags=["nodes"])
 
+# Upper bound on nodes running at once within a single flow execution
+MAX_CONCURRENT_NODES = int(os.getenv("MAX_CONCURRENT_NODES", "10"))
+
+# Upper bound on in-flight calls per language model service, shared by all flows;
+# nodes pick their service via the "service" parameter
+LM_CONCURRENCY: Dict[str, int] = {
+    service: int(os.getenv(f"{service.upper()}_CONCURRENCY", "8"))
+    for service in ("openai", "groq", "ollama")
+}
+
+# Semaphores enforcing LM_CONCURRENCY, created per event loop on first use since an
+# asyncio.Semaphore is bound to the loop it is first awaited on
+_LM_SEMAPHORES: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = weakref.WeakKeyDictionary()
+
+
+def _lm_semaphore(service: str) -> Optional[asyncio.Semaphore]:
+    """Return the running loop's semaphore for a language model service, or None if it has no limit."""
+    limit = LM_CONCURRENCY.get(service)
+    if limit is None:
+        return None
+    semaphores = _LM_SEMAPHORES.setdefault(asyncio.get_running_loop(), {})
+    semaphore = semaphores.get(service)
+    if semaphore is None:
+        semaphore = semaphores[service] = asyncio.Semaphore(limit)
+    return semaphore
+
+# Size limits for a single flow payload
+MAX_NODES = int(os.getenv("MAX_NODES", "500"))
+MAX_EDGES = int(os.getenv("MAX_EDGES", "5000"))
+
+# Optional in-process cache of /execute responses keyed by payload hash (0 disables it)
+FLOW_CACHE_TTL = float(os.getenv("FLOW_CACHE_TTL", "0"))
+FLOW_CACHE_MAX_ENTRIES = int(os.getenv("FLOW_CACHE_MAX_ENTRIES", "256"))
+
+# key -> (expires_at, serialized response), oldest first
+_FLOW_CACHE: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+
+# Flow execution metrics (exposed on /metrics)
+_SIZE_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500)
+NODE_LATENCY = Histogram("flow_node_seconds", "Time spent in a node's run()", ["type"])
+FLOW_SIZE = Histogram("flow_node_count", "Nodes per executed flow", buckets=_SIZE_BUCKETS)
+FLOW_DEPTH = Histogram("flow_depth", "Longest dependency chain (in nodes) per executed flow", buckets=_SIZE_BUCKETS)
+FLOW_CACHE_REQUESTS = Counter("flow_cache_requests_total", "/execute response cache lookups", ["result"])
+
+@lru_cache(maxsize=128)
+def _resolve_node_class(type_name: str, registry_version: int):
+    """
+    Resolve a node type name to its registered class.
+    
+    The registry version is part of the cache key, so registering a node
+    invalidates earlier resolutions without an explicit cache_clear().
+    """
+    return node_registry.get_node_class(type_name)
+
+
+def _create_node(type_name: str):
+    """Instantiate a fresh node of the given type, or None if it is unknown."""
+    node_class = _resolve_node_class(type_name, node_registry.version)
+    return node_class() if node_class else None
+
+
+@lru_cache(maxsize=128)
+def _cached_node_schema(node_name: str, registry_version: int) -> Optional[Dict[str, Any]]:
+    """Schema of a default-configured node; schemas only change on re-registration."""
+    node = _create_node(node_name)
+    return node.get_schema() if node else None
+
+
+def _get_node_schema(node_name: str) -> Optional[Dict[str, Any]]:
+    """Return the (cached) schema for a node type, or None if it is unknown."""
+    return _cached_node_schema(node_name, node_registry.version)
+
+
+@lru_cache(maxsize=128)
+def _cached_node_schema_bytes(node_name: str, registry_version: int) -> Optional[bytes]:
+    """Serialized {"success": True, "data": schema} envelope for a node type."""
+    schema = _cached_node_schema(node_name, registry_version)
+    if not schema:
+        return None
+    return orjson.dumps({"success": True, "data": schema})
+
+
+@lru_cache(maxsize=256)
+def _cached_configured_schema_bytes(node_id: str, registry_version: int, config_json: bytes) -> Optional[bytes]:
+    """
+    Serialized schema of a node after applying its update_<param> hooks.
+    
+    Args:
+        node_id: The node type identifier
+        registry_version: Registry version the entry belongs to
+        config_json: Canonical (sorted-key) JSON of the hook parameters
+        
+    Returns:
+        {"success": True, "data": schema} as JSON bytes, or None if the node is unknown
+    """
+    node = _create_node(node_id)
+    if node is None:
+        return None
+    for param_name, param_value in orjson.loads(config_json).items():
+        getattr(node, f'update_{param_name}')(param_value)
+    return orjson.dumps({"success": True, "data": node.get_schema()})
+
+
+# Serialized GET /nodes/ response and the registry version it was built from
+_ALL_NODES_BYTES: Optional[bytes] = None
+_ALL_NODES_VERSION = -1
+
+
+def _build_all_nodes_data() -> Dict[str, Any]:
+    """Collect every registered node's schema (tolerant to per-node errors)."""
+    node_names = node_registry.list_nodes()
+    
+    schemas: Dict[str, Any] = {}
+    schema_errors: Dict[str, str] = {}
+    for node_name in node_names:
+        try:
+            schema = _get_node_schema(node_name)
+            if schema:
+                schemas[node_name] = schema
+            else:
+                schema_errors[node_name] = "No schema returned"
+        except Exception as e:
+            schema_errors[node_name] = str(e)
+    
+    # Partial results are returned as-is; per-node errors are included for visibility
+    return {
+        "nodes": node_names,
+        "schemas": schemas,
+        "errors": schema_errors,
+        "total_count": len(node_names)
+    }
+
+
+def _get_all_nodes_bytes() -> bytes:
+    """
+    Return the serialized GET /nodes/ response, rebuilding it only when the registry has changed.
+    Results with per-node errors are not cached so transient failures can recover.
+    """
+    global _ALL_NODES_BYTES, _ALL_NODES_VERSION
+    version = node_registry.version
+    if _ALL_NODES_BYTES is not None and _ALL_NODES_VERSION == version:
+        return _ALL_NODES_BYTES
+    
+    data = _build_all_nodes_data()
+    body = orjson.dumps({"success": True, "data": data})
+    if not data["errors"]:
+        _ALL_NODES_BYTES = body
+        _ALL_NODES_VERSION = version
+    return body
+
 
 def combine_multiple_inputs(values: List[Any]) -> Any:
     """
@@ -40,8 +196,16 @@ def combine_multiple_inputs(values: List[Any]) -> Any:
     if len(values) == 1:
         return values[0]
     
-    # Filter out None/empty values
-    non_empty_values = [v for v in values if v is not None and v != ""]
+    # Filter out None/empty values, classifying the rest in the same pass
+    non_empty_values = []
+    all_str = all_dict = all_list = True
+    for v in values:
+        if v is None or v == "":
+            continue
+        non_empty_values.append(v)
+        all_str = all_str and isinstance(v, str)
+        all_dict = all_dict and isinstance(v, dict)
+        all_list = all_list and isinstance(v, list)
     
     if not non_empty_values:
         return None
@@ -49,10 +213,10 @@ def combine_multiple_inputs(values: List[Any]) -> Any:
     if len(non_empty_values) == 1:
         return non_empty_values[0]
     
-    # Check if all values are strings
-    if all(isinstance(v, str) for v in non_empty_values):
-        # Combine strings intelligently
-        if all(len(v.strip()) > 0 for v in non_empty_values):
+    if all_str:
+        # Combine strings intelligently (empty strings were filtered, so only
+        # whitespace-only strings lack content)
+        if not any(v.isspace() for v in non_empty_values):
             # If all strings have content, combine them with context
             combined = "\n\n".join(non_empty_values)
             return f"Combined inputs:\n{combined}"
@@ -60,8 +224,7 @@ def combine_multiple_inputs(values: List[Any]) -> Any:
             # Return the longest non-empty string
             return max(non_empty_values, key=len)
     
-    # Check if all values are dictionaries
-    if all(isinstance(v, dict) for v in non_empty_values):
+    if all_dict:
         # Merge dictionaries
         combined_dict = {}
         for i, d in enumerate(non_empty_values):
@@ -76,8 +239,7 @@ def combine_multiple_inputs(values: List[Any]) -> Any:
                     combined_dict[key] = value
         return combined_dict
     
-    # Check if all values are lists
-    if all(isinstance(v, list) for v in non_empty_values):
+    if all_list:
         # Flatten and combine lists
         combined_list = []
         for v in non_empty_values:
@@ -92,7 +254,7 @@ def combine_multiple_inputs(values: List[Any]) -> Any:
     }
 
 
-@router.get("/", response_model=Dict[str, Any])
+@router.get("/")
 async def get_all_nodes():
     """
     Get all registered nodes with their complete schemas
@@ -103,37 +265,12 @@ async def get_all_nodes():
         - schemas: Dictionary mapping node names to their schemas
     """
     try:
-        # Get all registered node names
-        node_names = node_registry.list_nodes()
-        
-        # Get schemas for all nodes (tolerant to per-node errors)
-        schemas: Dict[str, Any] = {}
-        schema_errors: Dict[str, str] = {}
-        for node_name in node_names:
-            try:
-                schema = node_registry.get_node_schema(node_name)
-                if schema:
-                    schemas[node_name] = schema
-                else:
-                    schema_errors[node_name] = "No schema returned"
-            except Exception as e:
-                schema_errors[node_name] = str(e)
-        
-        # Return 200 with partial results; include per-node errors for visibility
-        return {
-            "success": True,
-            "data": {
-                "nodes": node_names,
-                "schemas": schemas,
-                "errors": schema_errors,
-                "total_count": len(node_names)
-            }
-        }
+        return Response(content=_get_all_nodes_bytes(), media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to retrieve nodes: {str(e)}")
 
 
-@router.get("/list", response_model=Dict[str, Any])
+@router.get("/list")
 async def list_nodes():
     """
     Get a simple list of all registered node names
@@ -154,7 +291,7 @@ async def list_nodes():
         raise HTTPException(status_code=500, detail=f"Failed to list nodes: {str(e)}")
 
 
-@router.get("/{node_name}", response_model=Dict[str, Any])
+@router.get("/{node_name}")
 async def get_node_schema(node_name: str):
     """
     Get schema for a specific node
@@ -166,22 +303,578 @@ async def get_node_schema(node_name: str):
         Dict containing the node schema
     """
     try:
-        schema = node_registry.get_node_schema(node_name)
-        if not schema:
+        body = _cached_node_schema_bytes(node_name, node_registry.version)
+        if body is None:
             raise HTTPException(status_code=404, detail=f"Node '{node_name}' not found")
         
-        return {
-            "success": True,
-            "data": schema
-        }
+        return Response(content=body, media_type="application/json")
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to retrieve node schema: {str(e)}")
 
 
-@router.post("/execute", response_model=Dict[str, Any])
-async def execute_flow(payload: Dict[str, Any]):
+# Normalized per-node view built during validation: (type_name, lowercased type, parameters)
+_NodeDescriptor = Tuple[str, str, Dict[str, Any]]
+
+
+@lru_cache(maxsize=1)
+def _cached_known_types(registry_version: int) -> FrozenSet[str]:
+    """Registered node type keys, rebuilt when the registry changes."""
+    return frozenset(node_registry.list_nodes())
+
+
+def _validate_payload(payload: Dict[str, Any]) -> Tuple[Dict[str, _NodeDescriptor], List[Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+    """
+    Check a flow payload in a single pass before any scheduler state is built.
+
+    Every problem found is reported together in one 400 response instead of
+    failing on the first.
+
+    Args:
+        payload: Flow description (see execute_flow)
+
+    Returns:
+        Tuple of (node_descriptors, edges, external_inputs), where node_descriptors maps
+        each node id to its (type_name, lowercased type, parameters)
+
+    Raises:
+        HTTPException: 413 if the flow exceeds MAX_NODES / MAX_EDGES,
+            400 listing every validation error
+    """
+    nodes_cfg: Dict[str, Any] = payload.get("nodes", {})
+    edges: List[Dict[str, Any]] = payload.get("edges", [])
+    external_inputs: Dict[str, Dict[str, Any]] = payload.get("inputs", {})
+
+    if not nodes_cfg:
+        raise HTTPException(status_code=400, detail="'nodes' is required and cannot be empty")
+
+    if len(nodes_cfg) > MAX_NODES or len(edges) > MAX_EDGES:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Workflow too large: at most {MAX_NODES} nodes and {MAX_EDGES} edges are allowed"
+        )
+
+    issues: List[str] = []
+    known_types = _cached_known_types(node_registry.version)
+
+    node_descriptors: Dict[str, _NodeDescriptor] = {}
+    type_set: Set[str] = set()
+    received_types: List[str] = []
+    for node_id, cfg in nodes_cfg.items():
+        type_name = cfg.get("type") or cfg.get("name")
+        received_types.append((type_name or "").lower())
+        if not type_name:
+            issues.append(f"Node '{node_id}' is missing 'type'")
+            continue
+        type_key = type_name.lower()
+        type_set.add(type_key)
+        if type_key not in known_types:
+            issues.append(f"Node '{node_id}' has unknown type '{type_name}'")
+        node_descriptors[node_id] = (type_name, type_key, cfg.get("parameters", {}))
+
+    # Enforce presence of QueryNode and ResponseNode in every workflow
+    has_query = "querynode" in type_set
+    has_response = "responsenode" in type_set
+    logger.debug("Received node types: %s (has_query=%s, has_response=%s)", type_set, has_query, has_response)
+    if not has_query or not has_response:
+        issues.append("Workflow must include at least one QueryNode and one ResponseNode")
+
+    for position, edge in enumerate(edges):
+        src = edge.get("from") if isinstance(edge, dict) else None
+        dst = edge.get("to") if isinstance(edge, dict) else None
+        src_node = src.get("node") if isinstance(src, dict) else None
+        dst_node = dst.get("node") if isinstance(dst, dict) else None
+        if not src_node or not dst_node:
+            issues.append(f"Edge {position} must include 'from.node' and 'to.node'")
+        elif src_node not in nodes_cfg or dst_node not in nodes_cfg:
+            issues.append(f"Edge {position} references unknown nodes: {src_node} -> {dst_node}")
+
+    if issues:
+        raise HTTPException(status_code=400, detail={
+            "message": "Invalid workflow payload",
+            "errors": issues,
+            # Kept from the earlier QueryNode/ResponseNode check for existing clients
+            "received_types": received_types,
+            "has_query_node": has_query,
+            "has_response_node": has_response
+        })
+
+    return node_descriptors, edges, external_inputs
+
+
+def _find_cycles(successors: List[List[int]]) -> List[List[int]]:
+    """
+    Find the cycles of a graph with Tarjan's strongly connected components algorithm.
+
+    Iterative, so deep graphs cannot hit the recursion limit.
+
+    Args:
+        successors: successors[i] lists the nodes fed by node i
+
+    Returns:
+        Components (lists of node indices) that contain a cycle, i.e. with more
+        than one node or a self-loop
+    """
+    n = len(successors)
+    index = [-1] * n
+    low = [0] * n
+    on_stack = [False] * n
+    stack: List[int] = []
+    counter = 0
+    cycles: List[List[int]] = []
+
+    for root in range(n):
+        if index[root] != -1:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        # Explicit DFS stack of (node, position of the next successor to visit)
+        work = [(root, 0)]
+        while work:
+            v, pos = work[-1]
+            if pos < len(successors[v]):
+                work[-1] = (v, pos + 1)
+                w = successors[v][pos]
+                if index[w] == -1:
+                    index[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack[w] = True
+                    work.append((w, 0))
+                elif on_stack[w]:
+                    low[v] = min(low[v], index[w])
+                continue
+
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                low[parent] = min(low[parent], low[v])
+            if low[v] == index[v]:
+                component = []
+                while True:
+                    w = stack.pop()
+                    on_stack[w] = False
+                    component.append(w)
+                    if w == v:
+                        break
+                if len(component) > 1 or v in successors[v]:
+                    cycles.append(component)
+
+    return cycles
+
+
+def _build_flow_graph(
+    node_descriptors: Dict[str, _NodeDescriptor],
+    edges: List[Dict[str, Any]],
+    external_inputs: Dict[str, Dict[str, Any]]
+) -> Tuple[
+    List[str],
+    List[_NodeDescriptor],
+    Dict[str, Dict[str, Any]],
+    List[List[Tuple[int, str, str]]],
+    List[List[int]],
+    array
+]:
+    """
+    Build the adjacency and dependency structures for a validated flow.
+
+    Nodes are addressed by their integer index in node_ids from here on, so the
+    scheduler works on plain lists instead of string-keyed dicts.
+
+    Args:
+        node_descriptors: Normalized node descriptors keyed by node id
+        edges: Edge list (already checked by _validate_payload)
+        external_inputs: Optional external inputs per node id
+
+    Raises:
+        HTTPException: 400 if the graph contains a cycle
+
+    Returns:
+        Tuple of (node_ids, node_descs, external_inputs, incoming, successors, in_degree) where
+        incoming[i] holds (source_index, source_output, input_key) edges into node i, with
+        input_key already defaulted to the source output (or "default"),
+        successors[i] the target of every edge leaving node i and in_degree[i] the
+        number of edges entering node i
+    """
+    # Build index-based adjacency and dependency structures
+    node_ids: List[str] = list(node_descriptors)
+    node_descs: List[_NodeDescriptor] = list(node_descriptors.values())
+    index: Dict[str, int] = {nid: i for i, nid in enumerate(node_ids)}
+    n = len(node_ids)
+    incoming: List[List[Tuple[int, str, str]]] = [[] for _ in range(n)]
+    successors: List[List[int]] = [[] for _ in range(n)]
+    in_degree = array("i", [0]) * n
+
+    logger.debug("Building edge maps for %d edges", len(edges))
+    for edge in edges:
+        src = edge["from"]
+        dst = edge["to"]
+        src_idx = index[src["node"]]
+        dst_idx = index[dst["node"]]
+        src_output = src.get("output", "")
+        incoming[dst_idx].append((src_idx, src_output, dst.get("input", "") or src_output or "default"))
+        # Counted per edge; the scheduler decrements once per successor entry
+        successors[src_idx].append(dst_idx)
+        in_degree[dst_idx] += 1
+
+    cycles = _find_cycles(successors)
+    if cycles:
+        raise HTTPException(status_code=400, detail={
+            "message": "Cyclic graph",
+            "cycles": [[node_ids[i] for i in sorted(component)] for component in cycles]
+        })
+
+    return node_ids, node_descs, external_inputs, incoming, successors, in_degree
+
+
+def _critical_path_lengths(successors: List[List[int]], in_degree: array) -> List[int]:
+    """
+    Length (in nodes) of the longest chain starting at each node of an acyclic graph.
+
+    Args:
+        successors: successors[i] lists the nodes fed by node i
+        in_degree: Number of edges entering each node (not modified)
+
+    Returns:
+        List where entry i is 1 for sinks and 1 + the maximum over successors otherwise
+    """
+    n = len(successors)
+    remaining = array("i", in_degree)
+    stack = [i for i in range(n) if remaining[i] == 0]
+    order: List[int] = []
+    while stack:
+        i = stack.pop()
+        order.append(i)
+        for successor in successors[i]:
+            remaining[successor] -= 1
+            if remaining[successor] == 0:
+                stack.append(successor)
+
+    lengths = [1] * n
+    for i in reversed(order):
+        for successor in successors[i]:
+            if lengths[successor] >= lengths[i]:
+                lengths[i] = lengths[successor] + 1
+    return lengths
+
+
+# Per-node execution state in _iter_flow_events
+_PENDING, _EXECUTED, _SKIPPED, _FAILED = range(4)
+
+
+def _make_input_builder(
+    node_id: str,
+    node_ids: List[str],
+    incoming_edges: List[Tuple[int, str, str]]
+) -> Callable[[bytearray, List[Optional[Dict[str, Any]]], Dict[str, Any]], Tuple[Optional[Dict[str, Any]], int]]:
+    """
+    Specialize input assembly for one node of a flow.
+
+    Edges are grouped by source node once here, and nodes whose incoming edges
+    all feed distinct inputs skip the grouping/combining step entirely.
+
+    Args:
+        node_id: Id of the node the inputs are built for (for log messages)
+        node_ids: All node ids, indexed like the scheduler state
+        incoming_edges: (source_index, source_output, input_key) edges into the node
+
+    Returns:
+        build(state, results, external_inputs) -> (inputs, missing_source); inputs is
+        None when upstream node missing_source finished without results
+    """
+    # Group edges by source node so each upstream result is looked up once
+    mappings_by_source: Dict[int, List[Tuple[str, str]]] = {}
+    for src_idx, src_output, input_key in incoming_edges:
+        mappings_by_source.setdefault(src_idx, []).append((src_output, input_key))
+    sources = tuple((src_idx, tuple(mappings)) for src_idx, mappings in mappings_by_source.items())
+    input_keys = [input_key for _, mappings in sources for _, input_key in mappings]
+    distinct_keys = len(set(input_keys)) == len(input_keys)
+
+    def routed_values(state: bytearray, results: List[Optional[Dict[str, Any]]]):
+        """Yield (input_key, value) for active edges, or (None, src_idx) for a missing upstream result."""
+        for src_idx, mappings in sources:
+            src_node = node_ids[src_idx]
+
+            if state[src_idx] == _SKIPPED:
+                # Skipped upstream node -> its sockets are all inactive
+                logger.debug("ROUTING: skipping edges from skipped node '%s' -> '%s'", src_node, node_id)
+                continue
+
+            src_payload = results[src_idx]
+            if src_payload is None:
+                yield None, src_idx
+                return
+
+            for src_output, input_key in mappings:
+                if src_output:
+                    # Follow only active sockets: key must exist and be non-empty
+                    if src_output in src_payload:
+                        candidate = src_payload[src_output]
+                        # Inactive means None or an empty str/list/dict; 0 and False stay active
+                        if candidate is None or (not candidate and isinstance(candidate, (str, list, dict))):
+                            # Inactive socket -> skip this edge
+                            logger.debug("ROUTING: skipping inactive socket '%s' from '%s' -> '%s'", src_output, src_node, node_id)
+                            continue
+                        yield input_key, candidate
+                    else:
+                        # Requested output not present -> skip this edge entirely
+                        logger.debug("ROUTING: output '%s' missing on '%s', available=%s", src_output, src_node, src_payload.keys())
+                else:
+                    # If output not specified, try to merge all outputs
+                    if len(src_payload) == 1:
+                        yield input_key, next(iter(src_payload.values()))
+                    else:
+                        yield input_key, src_payload
+
+    if distinct_keys:
+        def build(state, results, external):
+            built_inputs = dict(external)
+            for input_key, value in routed_values(state, results):
+                if input_key is None:
+                    return None, value
+                built_inputs[input_key] = value
+            return built_inputs, -1
+        return build
+
+    def build(state, results, external):
+        # Group incoming connections by input name to handle multiple connections
+        input_groups: Dict[str, List[Any]] = {}
+        for input_key, value in routed_values(state, results):
+            if input_key is None:
+                return None, value
+            input_groups.setdefault(input_key, []).append(value)
+
+        built_inputs = dict(external)
+        for input_key, values in input_groups.items():
+            # Multiple values - combine intelligently
+            built_inputs[input_key] = values[0] if len(values) == 1 else combine_multiple_inputs(values)
+        return built_inputs, -1
+    return build
+
+
+async def _iter_flow_events(
+    node_ids: List[str],
+    node_descs: List[_NodeDescriptor],
+    external_inputs: Dict[str, Dict[str, Any]],
+    incoming: List[List[Tuple[int, str, str]]],
+    successors: List[List[int]],
+    in_degree: array
+) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Run a validated flow graph, yielding (event, data) pairs as it progresses.
+
+    Yields a "node_done" event for every node once it has executed, been skipped
+    or failed, then a final "done" event with the aggregate result. The graph
+    must be acyclic (checked by _build_flow_graph), so every node gets scheduled.
+    """
+    # Track execution state by node index; string ids are only used for output
+    n = len(node_ids)
+    state = bytearray(n)
+    results: List[Optional[Dict[str, Any]]] = [None] * n
+    errors: Dict[str, str] = {}
+    response_node_inputs: Dict[str, Dict[str, Any]] = {}
+    # One instance per node type for this run (except BaseNode.stateful types)
+    instances: Dict[str, Any] = {}
+    input_builders = [_make_input_builder(node_ids[i], node_ids, incoming[i]) for i in range(n)]
+
+    def fail(i: int, message: str) -> None:
+        state[i] = _FAILED
+        errors[node_ids[i]] = message
+
+    def prepare_node(i: int) -> Optional[Tuple[Any, Dict[str, Any], Dict[str, Any], str]]:
+        """
+        Build inputs for a node whose upstream nodes have all finished.
+        Returns (instance, inputs, parameters, type_key), or None if the node
+        was skipped or failed before it could run.
+        """
+        node_id = node_ids[i]
+        type_name, type_key, parameters = node_descs[i]
+        node_instance = instances.get(type_key)
+        if node_instance is None:
+            node_instance = _create_node(type_name)
+            if not node_instance.stateful:
+                instances[type_key] = node_instance
+
+        # Build inputs from external inputs and upstream edges
+        incoming_list = incoming[i]
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("EXECUTE -> Node '%s' type='%s'", node_id, type_name)
+            logger.debug("INCOMING -> %s", [(node_ids[s], out, inp) for s, out, inp in incoming_list])
+        built_inputs, missing_src = input_builders[i](state, results, external_inputs.get(node_id, {}))
+        if built_inputs is None:
+            fail(i, f"Upstream node '{node_ids[missing_src]}' has no results")
+            logger.warning("Node '%s': %s", node_id, errors[node_id])
+            return None
+
+        # If this node had incoming edges but no active routed inputs, skip silently
+        if incoming_list and (not built_inputs):
+            logger.debug("SKIP: Node '%s' has no active inputs after routing. Skipping execution.", node_id)
+            state[i] = _SKIPPED
+            return None
+
+        logger.debug("INPUTS -> %s", built_inputs)
+        logger.debug("PARAMS -> %s", parameters)
+        return node_instance, built_inputs, parameters, type_key
+
+    async def call_node(node_instance: Any, built_inputs: Dict[str, Any], parameters: Dict[str, Any], type_key: str) -> Any:
+        """Run a node off the event loop, bounded by the per-flow concurrency limit."""
+        async with node_semaphore:
+            with NODE_LATENCY.labels(type_key).time():
+                return await node_instance.arun(built_inputs, parameters)
+
+    async def run_node(node_instance: Any, built_inputs: Dict[str, Any], parameters: Dict[str, Any], type_key: str) -> Any:
+        """Run a node, first waiting for a slot on its language model service if it uses one."""
+        service = parameters.get("service")
+        service_semaphore = _lm_semaphore(service.lower()) if isinstance(service, str) else None
+        if service_semaphore is None:
+            return await call_node(node_instance, built_inputs, parameters, type_key)
+        # Taken before the per-flow slot so waiting on a busy service doesn't block other nodes
+        async with service_semaphore:
+            return await call_node(node_instance, built_inputs, parameters, type_key)
+
+    def finish_node(i: int, built_inputs: Dict[str, Any], output: Any) -> None:
+        """Record a node's output, or the exception it raised."""
+        node_id = node_ids[i]
+        type_name, type_key, _ = node_descs[i]
+        if isinstance(output, BaseException):
+            tb = "".join(traceback.format_exception(type(output), output, output.__traceback__))
+            fail(i, f"{output}\n{tb}")
+            logger.error("EXCEPTION in node '%s' type='%s': %s", node_id, type_name, errors[node_id])
+            return
+
+        results[i] = output if isinstance(output, dict) else {"result": output}
+        logger.debug("OUTPUTS <- %s", results[i])
+        state[i] = _EXECUTED
+
+        # Capture inputs and outputs for ResponseNode(s) only (for minimal API output)
+        if type_key == "responsenode":
+            # Include both inputs and outputs for ResponseNode
+            response_node_inputs[node_id] = {
+                **built_inputs,  # Inputs received
+                **results[i]  # Outputs produced (like final_response)
+            }
+
+    def node_event(i: int) -> Dict[str, Any]:
+        """Describe how a finished node ended up."""
+        node_id = node_ids[i]
+        if state[i] == _EXECUTED:
+            return {"node_id": node_id, "status": "executed", "output": results[i]}
+        if state[i] == _SKIPPED:
+            return {"node_id": node_id, "status": "skipped"}
+        return {"node_id": node_id, "status": "error", "error": errors.get(node_id, "")}
+
+    # Kahn's algorithm: a node is ready once every upstream node has finished
+    # (executed, skipped or failed), so each node is visited exactly once.
+    # Ready nodes are dispatched as soon as their last dependency completes,
+    # without waiting for unrelated siblings that are still running, and those
+    # on the longest remaining chain go first when concurrency is limited.
+    critical_path = _critical_path_lengths(successors, in_degree)
+    ready = [(-critical_path[i], i) for i in range(n) if in_degree[i] == 0]
+    heapq.heapify(ready)
+    FLOW_SIZE.observe(n)
+    FLOW_DEPTH.observe(max(critical_path, default=0))
+    node_semaphore = asyncio.Semaphore(MAX_CONCURRENT_NODES)
+    running: Dict["asyncio.Task[Any]", Tuple[int, Dict[str, Any]]] = {}
+
+    try:
+        while ready or running:
+            finished: List[int] = []
+            while ready:
+                _, i = heapq.heappop(ready)
+                job = prepare_node(i)
+                if job is None:
+                    # Skipped or failed while building inputs -> finished right away
+                    finished.append(i)
+                else:
+                    running[asyncio.create_task(run_node(*job))] = (i, job[1])
+
+            if not finished:
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    i, built_inputs = running.pop(task)
+                    exc = task.exception()
+                    finish_node(i, built_inputs, exc if exc is not None else task.result())
+                    finished.append(i)
+
+            for i in finished:
+                yield "node_done", node_event(i)
+                for successor in successors[i]:
+                    in_degree[successor] -= 1
+                    if in_degree[successor] == 0:
+                        heapq.heappush(ready, (-critical_path[successor], successor))
+    finally:
+        # Client went away mid-stream: don't leave node tasks running unobserved
+        for task in running:
+            task.cancel()
+
+    # Minimal response: only what ResponseNode(s) received as input
+    logger.debug("FLOW RESULT -> Response node inputs: %s", response_node_inputs)
+    yield "done", {
+        "response_inputs": response_node_inputs,
+        "executed_nodes": [node_ids[i] for i in range(n) if state[i] == _EXECUTED],
+        "skipped_nodes": [node_ids[i] for i in range(n) if state[i] == _SKIPPED],
+        "errors": errors
+    }
+
+
+def _flow_cache_key(payload: Dict[str, Any]) -> str:
+    """Stable hash of a flow payload (independent of key order)."""
+    return hashlib.blake2b(orjson.dumps(payload, option=orjson.OPT_SORT_KEYS), digest_size=16).hexdigest()
+
+
+def _flow_cache_get(key: str) -> Optional[bytes]:
+    """Return a cached /execute response body, dropping it if it has expired."""
+    entry = _FLOW_CACHE.get(key)
+    if entry is None:
+        return None
+    expires_at, body = entry
+    if expires_at <= time.monotonic():
+        del _FLOW_CACHE[key]
+        return None
+    _FLOW_CACHE.move_to_end(key)
+    return body
+
+
+def _flow_cache_put(key: str, body: bytes) -> None:
+    """Store an /execute response body, evicting the least recently used entries."""
+    _FLOW_CACHE[key] = (time.monotonic() + FLOW_CACHE_TTL, body)
+    _FLOW_CACHE.move_to_end(key)
+    while len(_FLOW_CACHE) > FLOW_CACHE_MAX_ENTRIES:
+        _FLOW_CACHE.popitem(last=False)
+
+
+async def _read_flow_payload(request: Request) -> Dict[str, Any]:
+    """
+    Decode a flow payload straight from the raw request body with orjson.
+
+    Args:
+        request: Incoming request
+
+    Returns:
+        Decoded payload
+
+    Raises:
+        HTTPException: 400 if the body is not a JSON object
+    """
+    try:
+        payload = orjson.loads(await request.body())
+    except orjson.JSONDecodeError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid JSON body: {e}")
+    if not isinstance(payload, dict):
+        raise HTTPException(status_code=400, detail="Request body must be a JSON object")
+    return payload
+
+
+def _format_sse(event: str, data: Dict[str, Any]) -> bytes:
+    """Encode one Server-Sent Events frame."""
+    return b"event: " + event.encode() + b"\ndata: " + dumps_json(data) + b"\n\n"
+
+
+@router.post("/execute")
+async def execute_flow(request: Request):
     """
     Execute a node flow described as a small workflow graph.
 
@@ -198,213 +891,74 @@ async def execute_flow(payload: Dict[str, Any]):
         "someNode": {"someInput": "value"}
       }
     }
+
+    When FLOW_CACHE_TTL is set, successful runs without node errors are cached
+    for that many seconds; send "Cache-Control: no-cache" to force a fresh run.
     """
+    payload = await _read_flow_payload(request)
     try:
-        nodes_cfg: Dict[str, Any] = payload.get("nodes", {})
-        edges: List[Dict[str, Any]] = payload.get("edges", [])
-        external_inputs: Dict[str, Dict[str, Any]] = payload.get("inputs", {})
-
-        if not nodes_cfg:
-            raise HTTPException(status_code=400, detail="'nodes' is required and cannot be empty")
-
-        # Enforce presence of QueryNode and ResponseNode in every workflow
-        type_values = [ (cfg.get("type") or cfg.get("name") or "").lower() for cfg in nodes_cfg.values() ]
-        print(f"DEBUG: Received node types: {type_values}")
-        has_query = any(t == "querynode" or t == "querynode".lower() or t == "querynode" for t in type_values)
-        has_response = any(t == "responsenode" or t == "responsenode".lower() or t == "responsenode" for t in type_values)
-        print(f"DEBUG: has_query={has_query}, has_response={has_response}")
-        if not has_query or not has_response:
-            raise HTTPException(status_code=400, detail={
-                "message": "Workflow must include at least one QueryNode and one ResponseNode",
-                "received_types": type_values,
-                "has_query_node": has_query,
-                "has_response_node": has_response
-            })
-
-        # Build adjacency and dependency maps
-        incoming_by_node: Dict[str, List[Dict[str, str]]] = {nid: [] for nid in nodes_cfg.keys()}
-        outgoing_by_node: Dict[str, List[Dict[str, str]]] = {nid: [] for nid in nodes_cfg.keys()}
-        depends_on: Dict[str, Set[str]] = {nid: set() for nid in nodes_cfg.keys()}
-
-        print(f"DEBUG: Building edge maps for {len(edges)} edges")
-        for edge in edges:
-            src = edge.get("from", {})
-            dst = edge.get("to", {})
-            src_node = src.get("node")
-            dst_node = dst.get("node")
-            if not src_node or not dst_node:
-                raise HTTPException(status_code=400, detail="Each edge must include 'from.node' and 'to.node'")
-            if src_node not in nodes_cfg or dst_node not in nodes_cfg:
-                raise HTTPException(status_code=400, detail=f"Edge references unknown nodes: {src_node} -> {dst_node}")
-            incoming_by_node[dst_node].append({"from": src_node, "output": src.get("output", ""), "input": dst.get("input", "")})
-            outgoing_by_node[src_node].append({"to": dst_node, "output": src.get("output", ""), "input": dst.get("input", "")})
-            depends_on[dst_node].add(src_node)
-
-        # Helper to instantiate node by type
-        def create_node_instance(type_name: str):
-            # Allow both class name and registry key (case-insensitive)
-            instance = node_registry.create_node(type_name)
-            if instance is None:
-                # Try lowercased typename as key
-                instance = node_registry.create_node(type_name.lower())
-            return instance
-
-        # Track execution state
-        executed: Set[str] = set()
-        results: Dict[str, Dict[str, Any]] = {}
-        errors: Dict[str, str] = {}
-        skipped: Set[str] = set()
-        response_node_inputs: Dict[str, Dict[str, Any]] = {}
-
-        # Execution loop: process nodes whose dependencies are satisfied
-        remaining_nodes = set(nodes_cfg.keys())
-        max_iterations = len(remaining_nodes) + 10  # safety
-        iterations = 0
-
-        while remaining_nodes and iterations < max_iterations:
-            iterations += 1
-            progressed = False
-
-            ready_nodes = [nid for nid in list(remaining_nodes) if depends_on[nid].issubset(executed)]
-            for node_id in ready_nodes:
-                node_spec = nodes_cfg[node_id]
-                type_name = node_spec.get("type") or node_spec.get("name")
-                if not type_name:
-                    errors[node_id] = "Missing 'type' for node"
-                    remaining_nodes.remove(node_id)
-                    progressed = True
-                    continue
-
-                node_instance = create_node_instance(type_name)
-                if node_instance is None:
-                    errors[node_id] = f"Unknown node type '{type_name}'"
-                    remaining_nodes.remove(node_id)
-                    progressed = True
-                    continue
-
-                # Build inputs from external inputs and upstream edges
-                built_inputs: Dict[str, Any] = {}
-                built_inputs.update(external_inputs.get(node_id, {}))
-
-                # Group incoming connections by input name to handle multiple connections
-                input_groups = {}
-                incoming_list = incoming_by_node.get(node_id, [])
-                print(f"\nEXECUTE -> Node '{node_id}' type='{type_name}'")
-                print(f"INCOMING -> {incoming_list}")
-                for inc in incoming_list:
-                    src_node = inc["from"]
-                    src_output = inc.get("output")
-                    dst_input = inc.get("input")
-
-                    if src_node not in results:
-                        errors[node_id] = f"Upstream node '{src_node}' has no results"
-                        print(f"ERROR: {errors[node_id]}")
-                        break
-                    
-                    src_payload = results[src_node]
-                    input_key = dst_input or src_output or "default"
-                    
-                    if src_output:
-                        # Follow only active sockets: key must exist and be non-empty
-                        if src_output in src_payload:
-                            candidate = src_payload[src_output]
-                            if candidate in (None, "", [], {}):
-                                # Inactive socket -> skip this edge
-                                print(f"ROUTING: skipping inactive socket '{src_output}' from '{src_node}' -> '{node_id}'")
-                                continue
-                            value = candidate
-                        else:
-                            # Requested output not present -> skip this edge entirely
-                            print(f"ROUTING: output '{src_output}' missing on '{src_node}', available={list(src_payload.keys())}")
-                            continue
-                    else:
-                        # If output not specified, try to merge all outputs
-                        if len(src_payload) == 1:
-                            value = list(src_payload.values())[0]
-                        else:
-                            value = src_payload
-                    
-                    # Group values by input key
-                    if input_key not in input_groups:
-                        input_groups[input_key] = []
-                    input_groups[input_key].append(value)
-
-                # Combine multiple values for each input
-                for input_key, values in input_groups.items():
-                    if len(values) == 1:
-                        # Single value - use as-is
-                        built_inputs[input_key] = values[0]
-                    else:
-                        # Multiple values - combine intelligently
-                        built_inputs[input_key] = combine_multiple_inputs(values)
-
-                # If this node had incoming edges but no active routed inputs, skip silently
-                if incoming_list and (not built_inputs):
-                    print(f"SKIP: Node '{node_id}' has no active inputs after routing. Skipping execution.")
-                    skipped.add(node_id)
-                    remaining_nodes.remove(node_id)
-                    progressed = True
-                    continue
-
-                if node_id in errors:
-                    remaining_nodes.remove(node_id)
-                    progressed = True
-                    continue
-
-                parameters: Dict[str, Any] = node_spec.get("parameters", {})
-
-                try:
-                    print(f"INPUTS -> {built_inputs}")
-                    print(f"PARAMS -> {parameters}")
-                    output = node_instance.run(built_inputs, parameters)
-                    results[node_id] = output if isinstance(output, dict) else {"result": output}
-                    print(f"OUTPUTS <- {results[node_id]}")
-                    executed.add(node_id)
-                except Exception as e:
-                    tb = traceback.format_exc()
-                    errors[node_id] = f"{e}\n{tb}"
-                    print(f"EXCEPTION in node '{node_id}' type='{type_name}': {errors[node_id]}")
-
-                remaining_nodes.remove(node_id)
-                progressed = True
-
-                # Capture inputs and outputs for ResponseNode(s) only (for minimal API output)
-                tn = (type_name or "").lower()
-                if tn == "responsenode":
-                    # Include both inputs and outputs for ResponseNode
-                    response_node_inputs[node_id] = {
-                        **built_inputs,  # Inputs received
-                        **results[node_id]  # Outputs produced (like final_response)
-                    }
-
-            if not progressed:
-                # Cycle or unresolved dependency
-                unresolved = list(remaining_nodes)
-                raise HTTPException(status_code=400, detail={
-                    "message": "Unresolved dependencies or cyclic graph",
-                    "unresolved_nodes": unresolved
+        cache_key = None
+        if FLOW_CACHE_TTL > 0:
+            cache_key = _flow_cache_key(payload)
+            if "no-cache" not in request.headers.get("cache-control", "").lower():
+                cached = _flow_cache_get(cache_key)
+                FLOW_CACHE_REQUESTS.labels("hit" if cached is not None else "miss").inc()
+                if cached is not None:
+                    return Response(content=cached, media_type="application/json")
+
+        graph = _build_flow_graph(*_validate_payload(payload))
+
+        async for event, data in _iter_flow_events(*graph):
+            if event == "done":
+                # Encode once: the same bytes are cached and sent, bypassing jsonable_encoder
+                body = dumps_json({
+                    "success": True,
+                    "data": data
                 })
+                if cache_key is not None and not data["errors"]:
+                    _flow_cache_put(cache_key, body)
+                return Response(content=body, media_type="application/json")
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to execute flow: {str(e)}")
 
-        # Minimal response: only what ResponseNode(s) received as input
-        print("FLOW RESULT -> Response node inputs:")
-        print(response_node_inputs)
-        return {
-            "success": True,
-            "data": {
-                "response_inputs": response_node_inputs,
-                "executed_nodes": list(executed),
-                "skipped_nodes": list(skipped),
-                "errors": errors
-            }
-        }
 
+@router.post("/execute/stream")
+async def execute_flow_stream(request: Request):
+    """
+    Execute a node flow and stream progress as Server-Sent Events.
+
+    Takes the same payload as /execute. Emits a "node_done" event as each node
+    finishes, then a final "done" event carrying the same data /execute returns.
+    Failures after streaming has started are reported as an "error" event.
+
+    Args:
+        request: Request whose body is the flow description (see /execute)
+
+    Returns:
+        text/event-stream response
+    """
+    payload = await _read_flow_payload(request)
+    try:
+        graph = _build_flow_graph(*_validate_payload(payload))
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to execute flow: {str(e)}")
 
+    async def event_stream():
+        try:
+            async for event, data in _iter_flow_events(*graph):
+                yield _format_sse(event, data)
+        except Exception as e:
+            yield _format_sse("error", {"message": f"Failed to execute flow: {str(e)}"})
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
 
-@router.get("/models/{service}", response_model=Dict[str, Any])
+
+@router.get("/models/{service}")
 async def get_service_models(service: str):
     """
     Get available models for a specific AI service
@@ -419,11 +973,11 @@ async def get_service_models(service: str):
         service_lower = service.lower()
         
         if service_lower == "openai":
-            service_instance = OpenAIService()
+            service_instance = OpenAIService.instance()
         elif service_lower == "groq":
-            service_instance = GroqService()
+            service_instance = GroqService.instance()
         elif service_lower == "ollama":
-            service_instance = OllamaService()
+            service_instance = OllamaService.instance()
         else:
             raise HTTPException(status_code=400, detail=f"Unknown service: {service}. Supported services: openai, groq, ollama")
         
@@ -439,7 +993,7 @@ async def get_service_models(service: str):
         raise HTTPException(status_code=500, detail=f"Failed to get models for service {service}: {str(e)}")
 
 
-@router.post("/{node_id}/update-config", response_model=Dict[str, Any])
+@router.post("/{node_id}/update-config")
 async def update_node_config(node_id: str, config: Dict[str, Any]):
     """
     Update node configuration and return updated schema
@@ -455,24 +1009,24 @@ async def update_node_config(node_id: str, config: Dict[str, Any]):
         Updated node schema with new outputs/inputs
     """
     try:
-        # Create node instance
-        node = node_registry.create_node(node_id)
-        if not node:
+        version = node_registry.version
+        node_class = _resolve_node_class(node_id, version)
+        if not node_class:
             raise HTTPException(status_code=404, detail=f"Node '{node_id}' not found")
         
-        
-        # Update other parameters if needed
-        for param_name, param_value in config.items():
-            if hasattr(node, f'update_{param_name}'):
-                getattr(node, f'update_{param_name}')(param_value)
-        
-        # Get updated schema
-        updated_schema = node.get_schema()
-        
-        return {
-            "success": True,
-            "data": updated_schema
+        # Only parameters with an update_<param> hook affect the schema
+        hook_config = {
+            param_name: param_value
+            for param_name, param_value in config.items()
+            if hasattr(node_class, f'update_{param_name}')
         }
+        if hook_config:
+            config_json = orjson.dumps(hook_config, option=orjson.OPT_SORT_KEYS)
+            body = _cached_configured_schema_bytes(node_id, version, config_json)
+        else:
+            body = _cached_node_schema_bytes(node_id, version)
+        
+        return Response(content=body, media_type="application/json")
         
     except HTTPException:
         raise
@@ -480,8 +1034,8 @@ async def update_node_config(node_id: str, config: Dict[str, Any]):
         raise HTTPException(status_code=500, detail=f"Failed to update node config: {str(e)}")
 
 
-@router.get("/{node_id}/schema", response_model=Dict[str, Any])
-async def get_node_schema(node_id: str):
+@router.get("/{node_id}/schema")
+async def get_current_node_schema(node_id: str):
     """
     Get the current schema for a specific node
     
@@ -492,16 +1046,11 @@ async def get_node_schema(node_id: str):
         Current node schema
     """
     try:
-        node = node_registry.create_node(node_id)
-        if not node:
+        body = _cached_node_schema_bytes(node_id, node_registry.version)
+        if body is None:
             raise HTTPException(status_code=404, detail=f"Node '{node_id}' not found")
         
-        schema = node.get_schema()
-        
-        return {
-            "success": True,
-            "data": schema
-        }
+        return Response(content=body, media_type="application/json")
         
     except HTTPException:
         raise
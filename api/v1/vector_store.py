@@ -4,13 +4,18 @@ Vector Store API Endpoints
 This module provides API endpoints for vector store operations.
 """
 
-from fastapi import APIRouter, HTTPException, Depends
-from typing import List, Dict, Any, Optional
+from fastapi import APIRouter, HTTPException, Depends, Request
+from typing import List, Dict, Any, Literal, Optional
 from pydantic import BaseModel
+import asyncio
 import logging
+import os
+import orjson
 
-from vector_store_services.qdrant_service.qdrant_service import QdrantService, EmbeddingPayload, SearchResult
+from api.responses import dumps_json, etag_response
+from vector_store_services.qdrant_service.qdrant_service import DEFAULT_QUANTIZATION, QdrantService, EmbeddingPayload, SearchResult
 from vector_store_services.config import VectorStoreConfig
+from vector_store_services.query_cache import QueryCache
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +24,37 @@ router = APIRouter(prefix="/api/v1/vector-store", tags=["vector-store"])
 # Initialize Qdrant service
 qdrant_service = QdrantService(**VectorStoreConfig.get_qdrant_config())
 
+# Semantic cache in front of /search; entries for a collection are dropped on writes to it.
+# Registered on the service class so writes from any QdrantService in this process
+# (e.g. the vector store tools used by flows) invalidate it, not only these endpoints.
+query_cache = QueryCache(**VectorStoreConfig.get_query_cache_config())
+QdrantService.add_write_listener(query_cache.invalidate)
+
+# Largest /embeddings/batch request accepted; bigger imports should be split client-side
+MAX_EMBEDDINGS_PER_BATCH = int(os.getenv("MAX_EMBEDDINGS_PER_BATCH", "10000"))
+
+# Cap on concurrent per-collection info requests issued by list_collections
+COLLECTION_INFO_CONCURRENCY = 16
+
+
+async def _gather_collection_info(collection_names: List[str]) -> List[Optional[Dict[str, Any]]]:
+    """
+    Fetch info for several collections concurrently.
+
+    Args:
+        collection_names: Collections to describe
+
+    Returns:
+        Collection info (or None) per name, in the same order
+    """
+    semaphore = asyncio.Semaphore(COLLECTION_INFO_CONCURRENCY)
+
+    async def fetch(collection_name: str) -> Optional[Dict[str, Any]]:
+        async with semaphore:
+            return await qdrant_service.aget_collection_info(collection_name)
+
+    return await asyncio.gather(*(fetch(name) for name in collection_names))
+
 
 # Pydantic models for API
 class EmbeddingRequest(BaseModel):
@@ -34,23 +70,32 @@ class SearchRequest(BaseModel):
     limit: int = 10
     score_threshold: float = 0.0
     metadata_filter: Optional[Dict[str, Any]] = None
+    # Candidate oversampling for int8-quantized collections (ignored on others)
+    oversampling: Optional[float] = 2.0
+
+
+class SearchBatchRequest(BaseModel):
+    queries: List[SearchRequest]
 
 
 class CollectionRequest(BaseModel):
     collection_name: str
     vector_size: int = 384
     distance: str = "Cosine"
+    # "int8" scalar quantization, or None to keep full-precision vectors only
+    quantization: Optional[Literal["int8"]] = DEFAULT_QUANTIZATION
 
 
 @router.get("/health")
 async def health_check():
     """Check if vector store service is healthy"""
     try:
-        is_healthy = qdrant_service.health_check()
+        is_healthy = await qdrant_service.ahealth_check()
         return {
             "success": True,
             "healthy": is_healthy,
             "service": "qdrant",
+            "query_cache": query_cache.stats(),
             "message": "Service is healthy" if is_healthy else "Service is not available - check Qdrant connection"
         }
     except Exception as e:
@@ -67,10 +112,11 @@ async def health_check():
 async def create_collection(request: CollectionRequest):
     """Create a new collection"""
     try:
-        success = qdrant_service.create_collection(
+        success = await qdrant_service.acreate_collection(
             collection_name=request.collection_name,
             vector_size=request.vector_size,
-            distance=request.distance
+            distance=request.distance,
+            quantization=request.quantization
         )
         
         if success:
@@ -87,15 +133,15 @@ async def create_collection(request: CollectionRequest):
 
 
 @router.get("/collections")
-async def list_collections():
+async def list_collections(request: Request):
     """List all collections with detailed information"""
     try:
-        collections = qdrant_service.list_collections()
+        collections = await qdrant_service.alist_collections()
         
         # Get detailed info for each collection
+        infos = await _gather_collection_info(collections)
         collection_details = []
-        for collection_name in collections:
-            info = qdrant_service.get_collection_info(collection_name)
+        for collection_name, info in zip(collections, infos):
             if info:
                 collection_details.append({
                     "name": collection_name,
@@ -113,11 +159,13 @@ async def list_collections():
                     "distance": "Unknown"
                 })
         
-        return {
+        body = dumps_json({
             "success": True,
             "total_collections": len(collections),
             "collections": collection_details
-        }
+        })
+        # Collections change through other endpoints, so clients must revalidate
+        return etag_response(body, request.headers.get("if-none-match"), "no-cache")
     except Exception as e:
         logger.error(f"Failed to list collections: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to list collections: {str(e)}")
@@ -127,7 +175,7 @@ async def list_collections():
 async def delete_collection(collection_name: str):
     """Delete a collection"""
     try:
-        success = qdrant_service.delete_collection(collection_name)
+        success = await qdrant_service.adelete_collection(collection_name)
         
         if success:
             return {
@@ -146,7 +194,7 @@ async def delete_collection(collection_name: str):
 async def get_collection_info(collection_name: str):
     """Get collection information"""
     try:
-        info = qdrant_service.get_collection_info(collection_name)
+        info = await qdrant_service.aget_collection_info(collection_name)
         
         if info:
             return {
@@ -172,7 +220,7 @@ async def add_embedding(request: EmbeddingRequest, collection_name: str = None):
             metadata=request.metadata
         )
         
-        success = qdrant_service.add_embedding(embedding, collection_name)
+        success = await qdrant_service.aadd_embedding(embedding, collection_name)
         
         if success:
             return {
@@ -188,25 +236,37 @@ async def add_embedding(request: EmbeddingRequest, collection_name: str = None):
 
 
 @router.post("/embeddings/batch")
-async def add_embeddings_batch(requests: List[EmbeddingRequest], collection_name: str = None):
-    """Add multiple embeddings in batch"""
+async def add_embeddings_batch(requests: List[EmbeddingRequest], collection_name: str = None, chunk_size: int = 256):
+    """
+    Add multiple embeddings in batch
+
+    Embeddings are converted and upserted chunk_size at a time rather than
+    building the whole converted list up front.
+    """
+    if len(requests) > MAX_EMBEDDINGS_PER_BATCH:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Too many embeddings: at most {MAX_EMBEDDINGS_PER_BATCH} per request"
+        )
     try:
-        embeddings = []
-        for request in requests:
-            embedding = EmbeddingPayload(
+        embeddings = (
+            EmbeddingPayload(
                 id=request.id,
                 vector=request.vector,
                 payload=request.payload,
                 metadata=request.metadata
             )
-            embeddings.append(embedding)
+            for request in requests
+        )
         
-        success = qdrant_service.add_embeddings_batch(embeddings, collection_name)
+        success = await qdrant_service.aadd_embeddings_batch(
+            embeddings, collection_name, batch_size=max(1, chunk_size)
+        )
         
         if success:
             return {
                 "success": True,
-                "message": f"Added {len(embeddings)} embeddings successfully"
+                "message": f"Added {len(requests)} embeddings successfully"
             }
         else:
             raise HTTPException(status_code=400, detail="Failed to add embeddings")
@@ -220,7 +280,7 @@ async def add_embeddings_batch(requests: List[EmbeddingRequest], collection_name
 async def get_embedding(embedding_id: str, collection_name: str = None):
     """Get an embedding by ID"""
     try:
-        embedding = qdrant_service.get_embedding(embedding_id, collection_name)
+        embedding = await qdrant_service.aget_embedding(embedding_id, collection_name)
         
         if embedding:
             return {
@@ -244,7 +304,7 @@ async def get_embedding(embedding_id: str, collection_name: str = None):
 async def delete_embedding(embedding_id: str, collection_name: str = None):
     """Delete an embedding by ID"""
     try:
-        success = qdrant_service.delete_embedding(embedding_id, collection_name)
+        success = await qdrant_service.adelete_embedding(embedding_id, collection_name)
         
         if success:
             return {
@@ -259,27 +319,48 @@ async def delete_embedding(embedding_id: str, collection_name: str = None):
         raise HTTPException(status_code=500, detail=f"Failed to delete embedding: {str(e)}")
 
 
+def _search_scope(request: SearchRequest) -> tuple:
+    """Query cache scope: everything besides the vector that affects /search results"""
+    return (
+        request.collection_name or qdrant_service.collection_name,
+        request.limit,
+        request.score_threshold,
+        request.oversampling,
+        orjson.dumps(request.metadata_filter, option=orjson.OPT_SORT_KEYS)
+    )
+
+
+def _search_result_to_dict(result: SearchResult) -> Dict[str, Any]:
+    """Convert a SearchResult to its API representation"""
+    return {
+        "id": result.id,
+        "score": result.score,
+        "payload": result.payload,
+        "metadata": result.metadata
+    }
+
+
 @router.post("/search")
 async def search_similar(request: SearchRequest):
     """Search for similar embeddings"""
     try:
-        results = qdrant_service.search_similar(
-            query_vector=request.query_vector,
-            collection_name=request.collection_name,
-            limit=request.limit,
-            score_threshold=request.score_threshold,
-            metadata_filter=request.metadata_filter
-        )
+        scope = _search_scope(request) if query_cache.enabled else None
+        results = query_cache.get(scope, request.query_vector) if scope else None
+        if results is None:
+            token = query_cache.token(scope) if scope else None
+            results = await qdrant_service.asearch_similar(
+                query_vector=request.query_vector,
+                collection_name=request.collection_name,
+                limit=request.limit,
+                score_threshold=request.score_threshold,
+                metadata_filter=request.metadata_filter,
+                oversampling=request.oversampling
+            )
+            if scope and results:
+                query_cache.put(scope, request.query_vector, results, token)
         
         # Convert SearchResult objects to dictionaries
-        search_results = []
-        for result in results:
-            search_results.append({
-                "id": result.id,
-                "score": result.score,
-                "payload": result.payload,
-                "metadata": result.metadata
-            })
+        search_results = [_search_result_to_dict(result) for result in results]
         
         return {
             "success": True,
@@ -292,6 +373,62 @@ async def search_similar(request: SearchRequest):
         raise HTTPException(status_code=500, detail=f"Failed to search: {str(e)}")
 
 
+@router.post("/search/batch")
+async def search_similar_batch(request: SearchBatchRequest):
+    """
+    Run several similarity searches in one call.
+
+    Queries are grouped by collection and each group is sent to Qdrant as
+    batched query requests instead of one round-trip per query.
+
+    Args:
+        request: Queries to run; each may target its own collection
+
+    Returns:
+        Results for each query, in the order the queries were given
+    """
+    try:
+        # Group query indices by target collection
+        groups: Dict[Optional[str], List[int]] = {}
+        for index, query in enumerate(request.queries):
+            groups.setdefault(query.collection_name, []).append(index)
+
+        group_results = await asyncio.gather(*(
+            qdrant_service.asearch_similar_batch(
+                [
+                    {
+                        "query_vector": request.queries[index].query_vector,
+                        "limit": request.queries[index].limit,
+                        "score_threshold": request.queries[index].score_threshold,
+                        "metadata_filter": request.queries[index].metadata_filter,
+                        "oversampling": request.queries[index].oversampling
+                    }
+                    for index in indices
+                ],
+                collection_name=collection_name
+            )
+            for collection_name, indices in groups.items()
+        ))
+
+        batch_results: List[List[Dict[str, Any]]] = [[] for _ in request.queries]
+        for indices, results_per_query in zip(groups.values(), group_results):
+            for index, results in zip(indices, results_per_query):
+                batch_results[index] = [_search_result_to_dict(result) for result in results]
+
+        return {
+            "success": True,
+            "results": [
+                {"index": index, "results": results, "count": len(results)}
+                for index, results in enumerate(batch_results)
+            ],
+            "count": len(batch_results)
+        }
+
+    except Exception as e:
+        logger.error(f"Failed to run batched search: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to search: {str(e)}")
+
+
 @router.post("/generate-id")
 async def generate_id():
     """Generate a unique ID for embeddings"""
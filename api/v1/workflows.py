@@ -2,14 +2,24 @@
 Workflows API - Minimal SQLite persistence (no Alembic)
 """
 
-import json
+import os
 import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
 
-from fastapi import APIRouter, HTTPException
+import orjson
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.concurrency import iterate_in_threadpool, run_in_threadpool
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel, Field
 
+from api.responses import dumps_json, etag_response, make_etag
+
 
 router = APIRouter(prefix="/workflows", tags=["workflows"])
 
@@ -20,79 +30,256 @@ DB_DIR.mkdir(parents=True, exist_ok=True)
 DB_PATH = DB_DIR / "workflows.db"
 
 
+# One connection shared by every request. Helpers run in the threadpool, so
+# all access goes through _CONN_LOCK; the connection is in autocommit mode and
+# writes open their own transaction via _write_transaction().
+_CONN: Optional[sqlite3.Connection] = None
+_CONN_LOCK = threading.Lock()
+
+
 def get_conn() -> sqlite3.Connection:
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    return conn
+    """Return the shared connection, opening and configuring it on first use. Hold _CONN_LOCK."""
+    global _CONN
+    if _CONN is None:
+        conn = sqlite3.connect(DB_PATH, check_same_thread=False, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        # WAL is persistent on the database file and lets readers run alongside a writer;
+        # with WAL, synchronous=NORMAL only risks the last commits on power loss
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
+        _CONN = conn
+    return _CONN
+
+
+@contextmanager
+def _write_transaction() -> Iterator[sqlite3.Connection]:
+    """Hold the connection lock and run the block in one transaction."""
+    with _CONN_LOCK:
+        conn = get_conn()
+        conn.execute("BEGIN")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+
+# Bump when init_db gains a migration step
+SCHEMA_VERSION = 1
 
 
 def init_db() -> None:
-    with get_conn() as conn:
+    # The schema version lives in the database header, so once migrated
+    # startup costs one PRAGMA read instead of a table_info probe
+    with _CONN_LOCK:
+        if get_conn().execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+            return
+    with _write_transaction() as conn:
         conn.execute(
             """
             CREATE TABLE IF NOT EXISTS workflows (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 name TEXT NOT NULL,
                 data_json TEXT NOT NULL,
-                created_at TEXT DEFAULT (datetime('now'))
+                created_at TEXT DEFAULT (datetime('now')),
+                data_zlib BLOB
             )
             """
         )
-        conn.commit()
+        # Databases created before graphs were stored compressed lack data_zlib
+        columns = {row["name"] for row in conn.execute("PRAGMA table_info(workflows)")}
+        if "data_zlib" not in columns:
+            conn.execute("ALTER TABLE workflows ADD COLUMN data_zlib BLOB")
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
 
 
 init_db()
 
 
+# In-memory TTL/LRU cache of decoded rows for the read endpoints. It is only
+# touched from the event loop (never inside run_in_threadpool), so needs no lock.
+WORKFLOW_CACHE_TTL = float(os.getenv("WORKFLOW_CACHE_TTL", "60"))
+WORKFLOW_CACHE_MAX_ENTRIES = int(os.getenv("WORKFLOW_CACHE_MAX_ENTRIES", "1024"))
+_LIST_KEY = "__list__"
+# Rows fetched and encoded per chunk when streaming the listing
+LIST_CHUNK_ROWS = 500
+_CACHE: "OrderedDict[Any, tuple]" = OrderedDict()
+# Bumped on every invalidation so a listing streamed across a write isn't cached
+_CACHE_GENERATION = 0
+
+
+def _cache_get(key: Any) -> Optional[Any]:
+    """Return a cached value, dropping it if it has expired."""
+    entry = _CACHE.get(key)
+    if entry is None:
+        return None
+    expires_at, value = entry
+    if expires_at <= time.monotonic():
+        del _CACHE[key]
+        return None
+    _CACHE.move_to_end(key)
+    return value
+
+
+def _cache_put(key: Any, value: Any) -> None:
+    """Store a value, evicting the least recently used entries."""
+    if WORKFLOW_CACHE_TTL <= 0:
+        return
+    _CACHE[key] = (time.monotonic() + WORKFLOW_CACHE_TTL, value)
+    _CACHE.move_to_end(key)
+    while len(_CACHE) > WORKFLOW_CACHE_MAX_ENTRIES:
+        _CACHE.popitem(last=False)
+
+
+def _cache_invalidate(workflow_id: Optional[int] = None) -> None:
+    """Drop the cached listing and, if given, one workflow's cached row."""
+    global _CACHE_GENERATION
+    _CACHE_GENERATION += 1
+    _CACHE.pop(_LIST_KEY, None)
+    if workflow_id is not None:
+        _CACHE.pop(workflow_id, None)
+
+
 class WorkflowIn(BaseModel):
     name: str = Field(..., min_length=1)
     data: Dict[str, Any] = Field(..., description="Workflow graph JSON")
 
 
-@router.get("/", response_model=Dict[str, Any])
-async def list_workflows():
+def _iter_workflow_rows() -> Iterator[bytes]:
+    """Yield the workflow listing as comma-joined orjson rows, one fetchmany batch at a time."""
+    # Own read-only connection: the cursor stays open across batches, which must not
+    # interleave with writes on the shared connection. Under WAL it reads a consistent
+    # snapshot without blocking writers. Batches are pulled from different threadpool
+    # threads, hence check_same_thread=False (only this generator uses the connection).
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
     try:
-        with get_conn() as conn:
-            rows = conn.execute(
-                "SELECT id, name, created_at FROM workflows ORDER BY id DESC"
-            ).fetchall()
-        items = [dict(r) for r in rows]
-        return {"success": True, "data": items}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to list workflows: {e}")
+        conn.execute("PRAGMA query_only=ON")
+        cur = conn.execute("SELECT id, name, created_at FROM workflows ORDER BY id DESC")
+        cols = [d[0] for d in cur.description]
+        while True:
+            rows = cur.fetchmany(LIST_CHUNK_ROWS)
+            if not rows:
+                return
+            yield b",".join(orjson.dumps(dict(zip(cols, r))) for r in rows)
+    finally:
+        conn.close()
+
+
+async def _stream_workflow_list() -> AsyncIterator[bytes]:
+    """Stream the {"success": true, "data": [...]} listing and cache the full body once sent."""
+    generation = _CACHE_GENERATION
+    chunks = [b'{"success":true,"data":[']
+    yield chunks[0]
+    async for rows in iterate_in_threadpool(_iter_workflow_rows()):
+        chunk = rows if len(chunks) == 1 else b"," + rows
+        chunks.append(chunk)
+        yield chunk
+    chunks.append(b"]}")
+    yield chunks[-1]
+    if generation == _CACHE_GENERATION:
+        _cache_put(_LIST_KEY, b"".join(chunks))
 
 
-@router.get("/{workflow_id}", response_model=Dict[str, Any])
-async def get_workflow(workflow_id: int):
+def _encode_graph(data: Dict[str, Any]) -> Tuple[str, bytes]:
+    """
+    Serialize a workflow graph for the data_json and data_zlib columns.
+
+    data_json is still written so a rollback to a release that only reads it keeps
+    working; stop filling it in the release that drops the column.
+    """
+    raw = orjson.dumps(data)
+    return raw.decode(), zlib.compress(raw, 6)
+
+
+def _decode_graph(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Read a workflow graph from data_zlib, falling back to data_json for older rows."""
+    if row["data_zlib"] is not None:
+        return orjson.loads(zlib.decompress(row["data_zlib"]))
+    return orjson.loads(row["data_json"])
+
+
+def _get_workflow(workflow_id: int) -> Optional[Dict[str, Any]]:
+    with _CONN_LOCK:
+        row = get_conn().execute(
+            "SELECT id, name, data_json, data_zlib, created_at FROM workflows WHERE id = ?",
+            (workflow_id,),
+        ).fetchone()
+    if not row:
+        return None
+    item = dict(row)
+    item["data"] = _decode_graph(item)
+    del item["data_json"], item["data_zlib"]
+    return item
+
+
+def _save_workflow(name: str, data: Dict[str, Any]) -> int:
+    with _write_transaction() as conn:
+        cur = conn.execute(
+            "INSERT INTO workflows (name, data_json, data_zlib) VALUES (?, ?, ?)",
+            (name, *_encode_graph(data)),
+        )
+        return cur.lastrowid
+
+
+def _save_workflows(items: List[WorkflowIn]) -> List[int]:
+    """Insert several workflows with one executemany in a single transaction."""
+    rows = [(item.name, *_encode_graph(item.data)) for item in items]
+    with _write_transaction() as conn:
+        conn.executemany("INSERT INTO workflows (name, data_json, data_zlib) VALUES (?, ?, ?)", rows)
+        last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+    # AUTOINCREMENT ids are assigned consecutively within the transaction
+    return list(range(last_id - len(rows) + 1, last_id + 1))
+
+
+@router.get("/")
+async def list_workflows():
+    body = _cache_get(_LIST_KEY)
+    if body is not None:
+        return Response(content=body, media_type="application/json")
+    # Rows are encoded and sent in batches rather than materialized as one list
+    return StreamingResponse(_stream_workflow_list(), media_type="application/json")
+
+
+@router.get("/{workflow_id}")
+async def get_workflow(workflow_id: int, request: Request):
     try:
-        with get_conn() as conn:
-            row = conn.execute(
-                "SELECT id, name, data_json, created_at FROM workflows WHERE id = ?",
-                (workflow_id,),
-            ).fetchone()
-        if not row:
-            raise HTTPException(status_code=404, detail="Workflow not found")
-        item = dict(row)
-        item["data"] = json.loads(item.pop("data_json"))
-        return {"success": True, "data": item}
+        # Cached as the encoded body plus its ETag, so hits skip encoding and hashing
+        cached = _cache_get(workflow_id)
+        if cached is None:
+            item = await run_in_threadpool(_get_workflow, workflow_id)
+            if not item:
+                raise HTTPException(status_code=404, detail="Workflow not found")
+            body = dumps_json({"success": True, "data": item})
+            cached = (body, make_etag(body))
+            _cache_put(workflow_id, cached)
+        body, etag = cached
+        return etag_response(body, request.headers.get("if-none-match"), "private, max-age=30", etag)
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get workflow: {e}")
 
 
-@router.post("/", response_model=Dict[str, Any])
+@router.post("/")
 async def save_workflow(payload: WorkflowIn):
     try:
-        with get_conn() as conn:
-            cur = conn.execute(
-                "INSERT INTO workflows (name, data_json) VALUES (?, ?)",
-                (payload.name, json.dumps(payload.data)),
-            )
-            conn.commit()
-            new_id = cur.lastrowid
+        new_id = await run_in_threadpool(_save_workflow, payload.name, payload.data)
+        _cache_invalidate(new_id)
         return {"success": True, "data": {"id": new_id}}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to save workflow: {e}")
 
 
+@router.post("/batch")
+async def save_workflows_batch(payload: List[WorkflowIn]):
+    if not payload:
+        raise HTTPException(status_code=400, detail="At least one workflow is required")
+    try:
+        new_ids = await run_in_threadpool(_save_workflows, payload)
+        _cache_invalidate()
+        return {"success": True, "data": {"ids": new_ids}}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to save workflows: {e}")
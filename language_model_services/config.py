@@ -1,21 +1,32 @@
+# Model lists are tuples (ordered, for get_models responses); the *_MODELS_SET
+# frozensets back the per-request availability checks
+
 # OpenAI language models
-OPENAI_MODELS = [
+OPENAI_MODELS = (
     "gpt-3.5-turbo",
     "gpt-3.5-turbo-instruct",
     "gpt-4o",
     "gpt-4o-mini",
     "gpt-5-preview"
-]
+)
 
 # Groq language models
-GROQ_MODELS = [
+GROQ_MODELS = (
     "llama-3.1-8b-instant",
     "llama-3.3-70b-versatile",
     "openai/gpt-oss-120b",
     "openai/gpt-oss-20b"
-]
+)
 
 # Ollama language models
-OLLAMA_MODELS = [
-    "phi3:mini"
-]
+OLLAMA_MODELS = (
+    "phi3:mini",
+)
+
+OPENAI_MODELS_SET = frozenset(OPENAI_MODELS)
+GROQ_MODELS_SET = frozenset(GROQ_MODELS)
+OLLAMA_MODELS_SET = frozenset(OLLAMA_MODELS)
+
+# Connection pool size for each provider SDK client (one client per API key)
+HTTP_MAX_CONNECTIONS = 100
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 20
@@ -1,32 +1,40 @@
 import os
-from typing import Dict, Any
-from ..config import OLLAMA_MODELS
+from typing import Dict, Any, Optional
+from ..config import OLLAMA_MODELS, OLLAMA_MODELS_SET
 import ollama
 
+# Common parameter names that Ollama spells differently; everything else passes through
+_OLLAMA_RENAME = {"max_tokens": "num_predict"}
+
 
 class OllamaService:
+    # Process-wide instance shared by nodes, tools and the API (see instance())
+    _instance: Optional["OllamaService"] = None
+
     def __init__(self):
         self.base_url = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
         self.models = OLLAMA_MODELS
+        self._models_set = OLLAMA_MODELS_SET
+        # Built once; models never change at runtime, and callers only read it
+        self._models_response = {"service": "ollama", "models": self.models}
+        # Created on first agenerate(); same host resolution as the module-level ollama.generate
+        self._aclient: Optional[ollama.AsyncClient] = None
+
+    @classmethod
+    def instance(cls) -> "OllamaService":
+        """Return the shared service, creating it on first use"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
 
     def generate(self, model_name: str, query: str, **kwargs) -> str:
         """Generate content using Ollama models"""
-        if model_name not in self.models:
-            raise ValueError(f"Model {model_name} not available. Available models: {self.models}")
+        if model_name not in self._models_set:
+            raise ValueError(f"Model {model_name} not available. Available models: {list(self.models)}")
 
         try:
             # Map common parameters to Ollama's parameter names
-            ollama_kwargs = {}
-            if 'max_tokens' in kwargs:
-                ollama_kwargs['num_predict'] = kwargs['max_tokens']
-            if 'temperature' in kwargs:
-                ollama_kwargs['temperature'] = kwargs['temperature']
-            # Add other Ollama-specific options here as needed
-            
-            # Merge with any remaining kwargs that don't need mapping
-            for key, value in kwargs.items():
-                if key not in ['max_tokens', 'temperature']:  # Already handled above
-                    ollama_kwargs[key] = value
+            ollama_kwargs = {_OLLAMA_RENAME.get(key, key): value for key, value in kwargs.items()}
             
             response = ollama.generate(
                 model=model_name,
@@ -37,9 +45,25 @@ class OllamaService:
         except Exception as e:
             raise Exception(f"Ollama API error: {str(e)}")
 
+    async def agenerate(self, model_name: str, query: str, **kwargs) -> str:
+        """Async variant of generate() for callers on the event loop"""
+        if model_name not in self._models_set:
+            raise ValueError(f"Model {model_name} not available. Available models: {list(self.models)}")
+
+        if self._aclient is None:
+            self._aclient = ollama.AsyncClient()
+
+        try:
+            ollama_kwargs = {_OLLAMA_RENAME.get(key, key): value for key, value in kwargs.items()}
+            response = await self._aclient.generate(
+                model=model_name,
+                prompt=query,
+                options=ollama_kwargs
+            )
+            return response["response"]
+        except Exception as e:
+            raise Exception(f"Ollama API error: {str(e)}")
+
     def get_models(self) -> Dict[str, Any]:
         """Get available Ollama models"""
-        return {
-            "service": "ollama",
-            "models": self.models
-        }
+        return self._models_response
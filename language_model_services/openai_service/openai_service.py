@@ -1,50 +1,171 @@
+import asyncio
+import logging
 import os
+import httpx
 import openai
-from typing import List, Dict, Any
-from ..config import OPENAI_MODELS
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Set
+from ..config import OPENAI_MODELS, OPENAI_MODELS_SET, HTTP_MAX_CONNECTIONS, HTTP_MAX_KEEPALIVE_CONNECTIONS
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=8)
+def _client_for(api_key: str) -> openai.OpenAI:
+    """One SDK client, and so one HTTP connection pool, per API key"""
+    return openai.OpenAI(
+        api_key=api_key,
+        http_client=httpx.Client(limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS
+        ))
+    )
+
+
+@lru_cache(maxsize=8)
+def _async_client_for(api_key: str) -> openai.AsyncOpenAI:
+    """Async counterpart of _client_for, used by agenerate()"""
+    return openai.AsyncOpenAI(
+        api_key=api_key,
+        http_client=httpx.AsyncClient(limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS
+        ))
+    )
+
+# Close tasks for replaced async clients, referenced until they finish
+_pending_closes: Set[asyncio.Task] = set()
+
+
+def _close_clients(client: openai.OpenAI, aclient: openai.AsyncOpenAI) -> None:
+    """
+    Close SDK clients replaced by a key change so their HTTP connection pools are released
+
+    Args:
+        client: Sync client to close
+        aclient: Async client to close; scheduled on the running loop if there is one
+    """
+    try:
+        client.close()
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Reloaded from a worker thread (sync generate()), so no loop to schedule on
+            asyncio.run(aclient.close())
+            return
+        task = loop.create_task(aclient.close())
+        _pending_closes.add(task)
+        task.add_done_callback(_pending_closes.discard)
+    except Exception as e:
+        logger.warning(f"Failed to close replaced OpenAI client: {e}")
 
 
 class OpenAIService:
+    # Process-wide instance shared by nodes, tools and the API (see instance())
+    _instance: Optional["OpenAIService"] = None
+
     def __init__(self):
         self.models = OPENAI_MODELS
+        self._models_set = OPENAI_MODELS_SET
+        # Built once; models never change at runtime, and callers only read it
+        self._models_response = {"service": "openai", "models": self.models}
         self._client = None
+        self._aclient = None
         self._api_key = None
         self._initialize_client()
 
-    def _initialize_client(self):
+    @classmethod
+    def instance(cls) -> "OpenAIService":
+        """Return the shared service, creating it on first use so its HTTP client is reused"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def reload_credentials(self) -> bool:
+        """
+        Pick up a changed OPENAI_API_KEY (e.g. after the credentials endpoints edit .env).
+
+        Also called by generate()/agenerate() when no key was set or the API rejects
+        the current one, so a key exported after startup is picked up without a restart.
+
+        Returns:
+            True if the key changed
+        """
+        return self._initialize_client()
+
+    def _initialize_client(self) -> bool:
         """Initialize or reinitialize the OpenAI client with current API key"""
         current_api_key = os.getenv("OPENAI_API_KEY")
-        if current_api_key != self._api_key:
-            self._api_key = current_api_key
-            if self._api_key:
-                self._client = openai.OpenAI(api_key=self._api_key)
-            else:
-                self._client = None
+        if current_api_key == self._api_key:
+            return False
+        if self._client is not None:
+            _close_clients(self._client, self._aclient)
+        # The cached clients for the old key are closed now; drop them so they are rebuilt if it comes back
+        _client_for.cache_clear()
+        _async_client_for.cache_clear()
+        self._api_key = current_api_key
+        if self._api_key:
+            self._client = _client_for(self._api_key)
+            self._aclient = _async_client_for(self._api_key)
+        else:
+            self._client = None
+            self._aclient = None
+        return True
 
     def generate(self, model_name: str, query: str, **kwargs) -> str:
         """Generate content using OpenAI models"""
-        if model_name not in self.models:
-            raise ValueError(f"Model {model_name} not available. Available models: {self.models}")
+        if model_name not in self._models_set:
+            raise ValueError(f"Model {model_name} not available. Available models: {list(self.models)}")
 
-        # Reinitialize client if API key has changed
-        self._initialize_client()
-        
+        if not self._client:
+            # The key may have been set after startup
+            self.reload_credentials()
         if not self._client:
             raise Exception("OpenAI API key not found. Please set OPENAI_API_KEY environment variable.")
 
-        try:
-            response = self._client.chat.completions.create(
-                model=model_name,
-                messages=[{"role": "user", "content": query}],
-                **kwargs
-            )
-            return response.choices[0].message.content
-        except Exception as e:
-            raise Exception(f"OpenAI API error: {str(e)}")
+        for attempt in range(2):
+            try:
+                response = self._client.chat.completions.create(
+                    model=model_name,
+                    messages=[{"role": "user", "content": query}],
+                    **kwargs
+                )
+                return response.choices[0].message.content
+            except openai.AuthenticationError as e:
+                # Retry once if the key was rotated outside the credentials endpoints
+                if attempt == 0 and self.reload_credentials() and self._client:
+                    continue
+                raise Exception(f"OpenAI API error: {str(e)}")
+            except Exception as e:
+                raise Exception(f"OpenAI API error: {str(e)}")
+
+    async def agenerate(self, model_name: str, query: str, **kwargs) -> str:
+        """Async variant of generate() for callers on the event loop"""
+        if model_name not in self._models_set:
+            raise ValueError(f"Model {model_name} not available. Available models: {list(self.models)}")
+
+        if not self._aclient:
+            # The key may have been set after startup
+            self.reload_credentials()
+        if not self._aclient:
+            raise Exception("OpenAI API key not found. Please set OPENAI_API_KEY environment variable.")
+
+        for attempt in range(2):
+            try:
+                response = await self._aclient.chat.completions.create(
+                    model=model_name,
+                    messages=[{"role": "user", "content": query}],
+                    **kwargs
+                )
+                return response.choices[0].message.content
+            except openai.AuthenticationError as e:
+                # Retry once if the key was rotated outside the credentials endpoints
+                if attempt == 0 and self.reload_credentials() and self._aclient:
+                    continue
+                raise Exception(f"OpenAI API error: {str(e)}")
+            except Exception as e:
+                raise Exception(f"OpenAI API error: {str(e)}")
 
     def get_models(self) -> Dict[str, Any]:
         """Get available OpenAI models"""
-        return {
-            "service": "openai",
-            "models": self.models
-        }
+        return self._models_response
@@ -2,17 +2,23 @@
 Development server for BotCanvas API
 """
 
+import os
+import sys
 import uvicorn
-from fastapi import FastAPI
+from dotenv import load_dotenv
+
+# Load environment variables once, before any module reads its settings
+load_dotenv()
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from prometheus_client import make_asgi_app
+from api.responses import AppJSONResponse
 from api.v1.nodes import router as nodes_router
 from api.v1.credentials import router as credentials_router
 from api.v1.workflows import router as workflows_router
 from api.v1.vector_store import router as vector_store_router
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
 # Register all nodes on startup
 try:
     from register_nodes import register_all_nodes
@@ -26,7 +32,8 @@ app = FastAPI(
     description="Development server for no-code chatbot builder API",
     version="dev",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=AppJSONResponse
 )
 
 # Add CORS middleware for development (allow all origins)
@@ -38,12 +45,29 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Reject oversized request bodies before they are read and parsed
+MAX_REQUEST_BYTES = int(os.getenv("MAX_REQUEST_BYTES", str(10 * 1024 * 1024)))
+
+@app.middleware("http")
+async def limit_request_size(request: Request, call_next):
+    """Return 413 for requests whose declared Content-Length exceeds MAX_REQUEST_BYTES"""
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > MAX_REQUEST_BYTES:
+        return AppJSONResponse(
+            status_code=413,
+            content={"detail": f"Request body too large (limit {MAX_REQUEST_BYTES} bytes)"}
+        )
+    return await call_next(request)
+
 # Include API routers
 app.include_router(nodes_router, prefix="/api/v1")
 app.include_router(credentials_router, prefix="/api/v1")
 app.include_router(workflows_router, prefix="/api/v1")
 app.include_router(vector_store_router)
 
+# Prometheus metrics (flow execution latency, sizes, cache hits)
+app.mount("/metrics", make_asgi_app())
+
 @app.get("/")
 async def root():
     """Root endpoint"""
@@ -55,7 +79,8 @@ async def root():
             "nodes": "/api/v1/nodes",
             "credentials": "/api/v1/credentials",
             "workflows": "/api/v1/workflows",
-            "vector-store": "/api/v1/vector-store"
+            "vector-store": "/api/v1/vector-store",
+            "metrics": "/metrics"
         }
     }
 
@@ -75,5 +100,7 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=True,  # Auto-reload on code changes
+        # uvloop is a requirement except on Windows, where it is unavailable
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
         log_level="info"
     )
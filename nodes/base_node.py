@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
@@ -62,6 +63,10 @@ class BaseNode(ABC):
     Provides a standardized interface for input/output handling and execution.
     """
     
+    # Set to True in nodes that keep per-call state on self; such nodes get a
+    # fresh instance for every execution instead of a shared one
+    stateful: bool = False
+    
     def __init__(self):
         self.node_id = self.__class__.__name__.lower()
         self.inputs = self._define_inputs()
@@ -122,7 +127,12 @@ class BaseNode(ABC):
         return True
     
     def get_schema(self) -> Dict[str, Any]:
-        """Get the complete schema for this node"""
+        """
+        Get the complete schema for this node.
+        
+        Builds a new dict on every call so callers may modify it. The API caches
+        the encoded schema per registry version, so this is off the hot path.
+        """
         return {
             "node_id": self.node_id,
             "name": self.__class__.__name__,
@@ -232,8 +242,21 @@ class BaseNode(ABC):
     
     def run(self, inputs: Dict[str, Any], parameters: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Main entry point for node execution with validation
+        Main entry point for node execution with validation.
+        
+        A single instance may serve several nodes of the same type within one
+        flow, possibly concurrently, so implementations must not store per-call
+        state on self unless the class sets stateful = True.
         """
         self.validate_inputs(inputs)
         self.validate_parameters(parameters)
         return self.execute(inputs, parameters)
+    
+    async def arun(self, inputs: Dict[str, Any], parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Async entry point used by the flow executor.
+        
+        Defaults to running run() in a worker thread; nodes that can await
+        their I/O (e.g. model calls) override this instead of run().
+        """
+        return await asyncio.to_thread(self.run, inputs, parameters)
@@ -218,9 +218,6 @@ class ConditionalNode(BaseNode):
             # Fallback safe default
             result = False
 
-        # Expose for template
-        self.node_data = {"operator": operator}
-
         # Emit only the active branch to avoid multiple-path routing conflicts
         output: Dict[str, Any] = {"condition": result}
         if result:
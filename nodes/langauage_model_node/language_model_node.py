@@ -320,21 +320,44 @@ class LanguageModelNode(BaseNode):
         """
         # Check if language model tool is available
         if LanguageModelTool is None:
-            return {
-                "response": "",
-                "metadata": {"error": "Language model tool not available"},
-                "success": False
-            }
+            return self._error_result("Language model tool not available")
         
         try:
-            # Extract inputs
-            query = inputs.get("query", "").strip()
-            context = inputs.get("context", "").strip()
-            
-            # Combine query and context intelligently
-            if context and query:
-                # If both are provided, create a comprehensive prompt
-                combined_query = f"""Based on the following context, please answer the user's question:
+            query, context, combined_query, request = self._build_request(inputs, parameters)
+            result = LanguageModelTool().generate_response(**request)
+            return self._format_result(result, query, context, combined_query)
+        except Exception as e:
+            return self._error_result(str(e))
+
+    async def arun(self, inputs: Dict[str, Any], parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Async entry point used by the flow executor.
+        
+        Same as run() but awaits the provider's async client, so a slow
+        model call doesn't hold a worker thread.
+        """
+        self.validate_inputs(inputs)
+        self.validate_parameters(parameters)
+        if LanguageModelTool is None:
+            return self._error_result("Language model tool not available")
+        
+        try:
+            query, context, combined_query, request = self._build_request(inputs, parameters)
+            result = await LanguageModelTool().agenerate_response(**request)
+            return self._format_result(result, query, context, combined_query)
+        except Exception as e:
+            return self._error_result(str(e))
+
+    def _build_request(self, inputs: Dict[str, Any], parameters: Dict[str, Any]):
+        """Combine query and context and collect the generate_response arguments"""
+        # Extract inputs
+        query = inputs.get("query", "").strip()
+        context = inputs.get("context", "").strip()
+        
+        # Combine query and context intelligently
+        if context and query:
+            # If both are provided, create a comprehensive prompt
+            combined_query = f"""Based on the following context, please answer the user's question:
 
 Context:
 {context}
@@ -342,59 +365,50 @@ Context:
 User Question: {query}
 
 Please provide a helpful and accurate response based on the context provided."""
-            elif context:
-                # If only context is provided, use it as the query
-                combined_query = context
-            else:
-                # If only query is provided, use it as is
-                combined_query = query
-            
-            # Extract parameters
-            service = parameters.get("service", "openai")
-            model = parameters.get("model", "")
-            system_prompt = parameters.get("system_prompt", "You are a helpful AI assistant.")
-            temperature = parameters.get("temperature", 0.7)
-            max_tokens = parameters.get("max_tokens", 500)
-            
-            # Initialize the language model tool
-            lm_tool = LanguageModelTool()
-            
-            # Generate response
-            result = lm_tool.generate_response(
-                query=combined_query,
-                service=service,
-                model=model if model else None,
-                system_prompt=system_prompt if system_prompt else None,
-                temperature=temperature,
-                max_tokens=max_tokens
-            )
-            
-            # Return results
-            if result["success"]:
-                return {
-                    "response": result["response"],
-                    "metadata": {
-                        "success": True,
-                        "service": result["metadata"]["service"],
-                        "model": result["metadata"]["model"],
-                        "query_length": len(query),
-                        "context_length": len(context),
-                        "combined_length": len(combined_query),
-                        "input_combination": "query_and_context" if context and query else ("context_only" if context else "query_only"),
-                        "response_length": result["metadata"]["response_length"]
-                    },
-                    "success": True
-                }
-            else:
-                return {
-                    "response": "",
-                    "metadata": {"error": result.get("error", "Unknown error")},
-                    "success": False
-                }
-                
-        except Exception as e:
-            return {
-                "response": "",
-                "metadata": {"error": str(e)},
-                "success": False
-            }
\ No newline at end of file
+        elif context:
+            # If only context is provided, use it as the query
+            combined_query = context
+        else:
+            # If only query is provided, use it as is
+            combined_query = query
+        
+        # Extract parameters
+        model = parameters.get("model", "")
+        system_prompt = parameters.get("system_prompt", "You are a helpful AI assistant.")
+        request = {
+            "query": combined_query,
+            "service": parameters.get("service", "openai"),
+            "model": model if model else None,
+            "system_prompt": system_prompt if system_prompt else None,
+            "temperature": parameters.get("temperature", 0.7),
+            "max_tokens": parameters.get("max_tokens", 500)
+        }
+        return query, context, combined_query, request
+
+    @staticmethod
+    def _format_result(result: Dict[str, Any], query: str, context: str, combined_query: str) -> Dict[str, Any]:
+        """Shape the tool result into this node's outputs"""
+        if not result["success"]:
+            return LanguageModelNode._error_result(result.get("error", "Unknown error"))
+        return {
+            "response": result["response"],
+            "metadata": {
+                "success": True,
+                "service": result["metadata"]["service"],
+                "model": result["metadata"]["model"],
+                "query_length": len(query),
+                "context_length": len(context),
+                "combined_length": len(combined_query),
+                "input_combination": "query_and_context" if context and query else ("context_only" if context else "query_only"),
+                "response_length": result["metadata"]["response_length"]
+            },
+            "success": True
+        }
+
+    @staticmethod
+    def _error_result(message: str) -> Dict[str, Any]:
+        return {
+            "response": "",
+            "metadata": {"error": message},
+            "success": False
+        }
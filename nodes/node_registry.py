@@ -11,15 +11,26 @@ class NodeRegistry:
     
     def __init__(self):
         self._nodes: Dict[str, Type[BaseNode]] = {}
+        self._version = 0
+    
+    @property
+    def version(self) -> int:
+        """Counter bumped on every registration, for invalidating derived caches."""
+        return self._version
     
     def register_node(self, node_class: Type[BaseNode], name: Optional[str] = None) -> None:
         """Register a node class."""
         node_name = name or node_class.__name__.lower()
         self._nodes[node_name] = node_class
+        self._version += 1
+    
+    def get_node_class(self, name: str) -> Optional[Type[BaseNode]]:
+        """Get a registered node class by name (case-insensitive)."""
+        return self._nodes.get(name.lower())
     
     def create_node(self, name: str) -> Optional[BaseNode]:
         """Create a node instance by name."""
-        node_class = self._nodes.get(name.lower())
+        node_class = self.get_node_class(name)
         if node_class:
             return node_class()
         return None
@@ -184,11 +184,6 @@ class ResponseNode(BaseNode):
             final_response = "No response yet"
             response_content = "No response yet"
         
-        # Store the response content in the node's data for display in the HTML template
-        self.node_data = {
-            "response_content": response_content
-        }
-        
         # Return the response as output for inline display
         return {
             "final_response": final_response,
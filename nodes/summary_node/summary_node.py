@@ -283,11 +283,11 @@ class SummaryNode(BaseNode):
     def _get_language_model_service(self, service: str):
         """Get the appropriate language model service"""
         if service == "openai" and OpenAIService:
-            return OpenAIService()
+            return OpenAIService.instance()
         elif service == "groq" and GroqService:
-            return GroqService()
+            return GroqService.instance()
         elif service == "ollama" and OllamaService:
-            return OllamaService()
+            return OllamaService.instance()
         else:
             raise ValueError(f"Unsupported service: {service}")
 
@@ -0,0 +1,101 @@
+"""
+Tests for the .env editing helpers in api.v1.credentials
+"""
+
+import os
+
+import pytest
+
+for _package in ("fastapi", "pydantic", "dotenv"):
+    pytest.importorskip(_package)
+
+import api.v1.credentials as credentials  # noqa: E402
+
+
+@pytest.fixture(params=["posix", "nt"])
+def remove_path(request, monkeypatch):
+    """Run each removal test against both the mmap path and the Windows fallback"""
+    if request.param == "nt":
+        monkeypatch.setattr(credentials.os, "name", "nt")
+    elif os.name == "nt":
+        pytest.skip("mmap removal path is not used on Windows")
+    return request.param
+
+
+@pytest.fixture
+def env_file(tmp_path):
+    return tmp_path / ".env"
+
+
+@pytest.mark.parametrize("key, expected", [
+    ("FIRST", ["MIDDLE=2", "LAST=3"]),
+    ("MIDDLE", ["FIRST=1", "LAST=3"]),
+    ("LAST", ["FIRST=1", "MIDDLE=2"]),
+])
+def test_remove_first_middle_and_last_key(remove_path, env_file, key, expected):
+    env_file.write_text("FIRST=1\nMIDDLE=2\nLAST=3\n", encoding="utf-8")
+
+    credentials._remove_env_key(env_file, key)
+
+    assert env_file.read_text(encoding="utf-8").splitlines() == expected
+
+
+@pytest.mark.parametrize("key, expected", [
+    ("B", ["A=1"]),
+    ("A", ["B=2"]),
+])
+def test_remove_key_without_trailing_newline(remove_path, env_file, key, expected):
+    env_file.write_text("A=1\nB=2", encoding="utf-8")
+
+    credentials._remove_env_key(env_file, key)
+
+    assert env_file.read_text(encoding="utf-8").splitlines() == expected
+
+
+def test_remove_only_matches_whole_keys(remove_path, env_file):
+    env_file.write_text("MY_KEY=1\nKEY=2\nOTHER=KEY=3\n  KEY=4\n", encoding="utf-8")
+
+    credentials._remove_env_key(env_file, "KEY")
+
+    assert env_file.read_text(encoding="utf-8").splitlines() == ["MY_KEY=1", "OTHER=KEY=3"]
+
+
+def test_remove_missing_key_and_empty_file(remove_path, env_file):
+    env_file.write_text("", encoding="utf-8")
+    credentials._remove_env_key(env_file, "NOPE")
+    assert env_file.read_text(encoding="utf-8") == ""
+
+    env_file.write_text("A=1\n", encoding="utf-8")
+    credentials._remove_env_key(env_file, "NOPE")
+    assert env_file.read_text(encoding="utf-8").splitlines() == ["A=1"]
+
+
+def test_env_cache_reuses_parse_until_file_changes(env_file):
+    env_file.write_text("A=1\n", encoding="utf-8")
+    first = credentials._load_env_cached(env_file)
+    assert credentials._load_env_cached(env_file) is first
+
+    # External edit: a newer mtime forces a re-parse
+    env_file.write_text("A=2\n", encoding="utf-8")
+    stat = env_file.stat()
+    os.utime(env_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert credentials._load_env_cached(env_file) == {"A": "2"}
+
+
+def test_env_cache_invalidated_by_save_and_delete(env_file, monkeypatch):
+    monkeypatch.delenv("TEST_CRED_KEY", raising=False)
+    env_file.write_text("A=1\n", encoding="utf-8")
+    assert credentials._load_env_cached(env_file) == {"A": "1"}
+    original_times = (env_file.stat().st_atime_ns, env_file.stat().st_mtime_ns)
+
+    # Writes must drop the cached parse even if the mtime doesn't move
+    # (coarse filesystem timestamps), so put the old mtime back after each one
+    credentials._save_credential(env_file, "TEST_CRED_KEY", "secret")
+    os.utime(env_file, ns=original_times)
+    assert credentials._load_env_cached(env_file) == {"A": "1", "TEST_CRED_KEY": "secret"}
+    assert os.environ["TEST_CRED_KEY"] == "secret"
+
+    credentials._delete_credential(env_file, "TEST_CRED_KEY")
+    os.utime(env_file, ns=original_times)
+    assert credentials._load_env_cached(env_file) == {"A": "1"}
+    assert "TEST_CRED_KEY" not in os.environ
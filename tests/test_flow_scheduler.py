@@ -0,0 +1,221 @@
+"""
+Behavioral tests for the flow scheduler in api.v1.nodes
+
+Flows are built from small test nodes registered under their own type names,
+so no language model or vector store is involved.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+for _package in ("fastapi", "orjson", "prometheus_client", "httpx", "openai", "groq", "ollama"):
+    pytest.importorskip(_package)
+
+import orjson  # noqa: E402
+from fastapi import HTTPException  # noqa: E402
+
+import api.v1.nodes as nodes_api  # noqa: E402
+from nodes.base_node import BaseNode, NodeOutput  # noqa: E402
+from nodes.node_registry import register_node  # noqa: E402
+
+
+class _Recorder:
+    """Thread-safe log of node start/end events and peak concurrency"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.events = []
+        self.active = 0
+        self.max_active = 0
+
+    def start(self, name):
+        with self.lock:
+            self.events.append(("start", name))
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+
+    def end(self, name):
+        with self.lock:
+            self.events.append(("end", name))
+            self.active -= 1
+
+    def position(self, kind, name):
+        return self.events.index((kind, name))
+
+
+recorder = _Recorder()
+
+
+class SchedTrackNode(BaseNode):
+    """Sleeps for the 'sleep' parameter and emits its 'name' parameter as 'value'"""
+
+    def _define_inputs(self):
+        return []
+
+    def _define_outputs(self):
+        return [NodeOutput("value", "string", "")]
+
+    def _define_parameters(self):
+        return []
+
+    def execute(self, inputs, parameters):
+        name = parameters["name"]
+        recorder.start(name)
+        try:
+            time.sleep(parameters.get("sleep", 0.02))
+        finally:
+            recorder.end(name)
+        return {"value": name}
+
+
+class SchedFailNode(SchedTrackNode):
+    """Always raises"""
+
+    def execute(self, inputs, parameters):
+        raise RuntimeError("node exploded")
+
+
+register_node(SchedTrackNode, "schedtracknode")
+register_node(SchedFailNode, "schedfailnode")
+
+
+@pytest.fixture(autouse=True)
+def fresh_recorder():
+    global recorder
+    recorder = _Recorder()
+    yield
+
+
+def _node(name, type_name="SchedTrackNode", **params):
+    return {"type": type_name, "parameters": {"name": name, **params}}
+
+
+def _edge(src, dst):
+    return {"from": {"node": src, "output": "value"}, "to": {"node": dst, "input": "value"}}
+
+
+def _graph(nodes, edges):
+    descriptors = {
+        node_id: (cfg["type"], cfg["type"].lower(), cfg["parameters"])
+        for node_id, cfg in nodes.items()
+    }
+    return nodes_api._build_flow_graph(descriptors, edges, {})
+
+
+def _collect(graph):
+    async def run():
+        return [event async for event in nodes_api._iter_flow_events(*graph)]
+    return asyncio.run(run())
+
+
+def test_diamond_runs_in_dependency_order():
+    nodes = {name: _node(name) for name in ("a", "b", "c", "d")}
+    graph = _graph(nodes, [_edge("a", "b"), _edge("a", "c"), _edge("b", "d"), _edge("c", "d")])
+
+    events = _collect(graph)
+
+    assert recorder.position("end", "a") < recorder.position("start", "b")
+    assert recorder.position("end", "a") < recorder.position("start", "c")
+    assert recorder.position("end", "b") < recorder.position("start", "d")
+    assert recorder.position("end", "c") < recorder.position("start", "d")
+
+    done_order = [data["node_id"] for event, data in events if event == "node_done"]
+    assert done_order[0] == "a" and done_order[-1] == "d"
+    assert sorted(done_order) == ["a", "b", "c", "d"]
+    final_event, final = events[-1]
+    assert final_event == "done"
+    assert sorted(final["executed_nodes"]) == ["a", "b", "c", "d"]
+    assert final["errors"] == {}
+
+
+def test_cycle_is_rejected_with_its_members():
+    nodes = {name: _node(name) for name in ("entry", "a", "b", "c", "self")}
+    edges = [
+        _edge("entry", "a"),
+        _edge("a", "b"), _edge("b", "c"), _edge("c", "a"),
+        _edge("self", "self"),
+    ]
+
+    with pytest.raises(HTTPException) as exc_info:
+        _graph(nodes, edges)
+
+    assert exc_info.value.status_code == 400
+    assert exc_info.value.detail["message"] == "Cyclic graph"
+    assert sorted(exc_info.value.detail["cycles"]) == [["a", "b", "c"], ["self"]]
+
+
+def test_concurrency_stays_within_max_concurrent_nodes(monkeypatch):
+    monkeypatch.setattr(nodes_api, "MAX_CONCURRENT_NODES", 2)
+    nodes = {f"n{i}": _node(f"n{i}", sleep=0.05) for i in range(6)}
+
+    events = _collect(_graph(nodes, []))
+
+    assert recorder.max_active == 2
+    assert len(events[-1][1]["executed_nodes"]) == 6
+
+
+def test_node_error_ends_stream_with_done():
+    nodes = {
+        "a": _node("a"),
+        "boom": _node("boom", type_name="SchedFailNode"),
+        "after": _node("after"),
+        "side": _node("side"),
+    }
+    graph = _graph(nodes, [_edge("a", "boom"), _edge("boom", "after"), _edge("a", "side")])
+
+    events = _collect(graph)
+
+    node_events = {data["node_id"]: data for event, data in events if event == "node_done"}
+    assert len(node_events) == 4
+    assert node_events["boom"]["status"] == "error"
+    assert "node exploded" in node_events["boom"]["error"]
+    # Downstream of the failure is reported as failed rather than run
+    assert node_events["after"]["status"] == "error"
+    assert ("start", "after") not in recorder.events
+    # Unrelated branches still complete
+    assert node_events["side"]["status"] == "executed"
+
+    assert [event for event, _ in events].count("done") == 1
+    final_event, final = events[-1]
+    assert final_event == "done"
+    assert set(final["errors"]) == {"boom", "after"}
+    assert sorted(final["executed_nodes"]) == ["a", "side"]
+
+
+def test_stream_endpoint_reports_node_error_then_done():
+    from nodes.query_node.query_node import QueryNode
+    from nodes.response_node.response_node import ResponseNode
+    register_node(QueryNode)
+    register_node(ResponseNode)
+    payload = {
+        "nodes": {
+            "q": {"type": "QueryNode", "parameters": {"query": "hi"}},
+            "boom": {"type": "SchedFailNode", "parameters": {"name": "boom"}},
+            "r": {"type": "ResponseNode", "parameters": {}},
+        },
+        "edges": [
+            {"from": {"node": "q", "output": "query"}, "to": {"node": "boom", "input": "value"}},
+            {"from": {"node": "boom", "output": "value"}, "to": {"node": "r", "input": "input_data"}},
+        ],
+    }
+
+    class FakeRequest:
+        async def body(self):
+            return orjson.dumps(payload)
+
+    async def read_stream():
+        response = await nodes_api.execute_flow_stream(FakeRequest())
+        return b"".join([frame async for frame in response.body_iterator])
+
+    frames = [frame for frame in asyncio.run(read_stream()).split(b"\n\n") if frame]
+    events = [
+        (frame.split(b"\n")[0][len(b"event: "):], orjson.loads(frame.split(b"\n")[1][len(b"data: "):]))
+        for frame in frames
+    ]
+    assert [name for name, _ in events] == [b"node_done", b"node_done", b"node_done", b"done"]
+    statuses = {data["node_id"]: data["status"] for name, data in events if name == b"node_done"}
+    assert statuses == {"q": "executed", "boom": "error", "r": "error"}
+    assert set(events[-1][1]["errors"]) == {"boom", "r"}
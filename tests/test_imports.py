@@ -0,0 +1,43 @@
+"""
+Import smoke tests
+
+Importing the API modules evaluates every route signature and module-level
+helper, so a broken import (e.g. an annotation referencing a name defined
+further down) fails here instead of at server startup.
+
+Run from the repository root with: python -m pytest tests
+"""
+
+import importlib
+
+import pytest
+
+# Third-party packages the app imports at startup; tests skip if one is missing
+REQUIRED_PACKAGES = (
+    "fastapi", "pydantic", "orjson", "httpx", "dotenv", "uvicorn",
+    "prometheus_client", "qdrant_client", "numpy", "openai", "groq", "ollama"
+)
+
+MODULES = (
+    "api.v1.nodes",
+    "api.v1.credentials",
+    "api.v1.workflows",
+    "api.v1.vector_store",
+    "main",
+)
+
+
+@pytest.mark.parametrize("module_name", MODULES)
+def test_module_imports(module_name):
+    for package in REQUIRED_PACKAGES:
+        pytest.importorskip(package)
+    importlib.import_module(module_name)
+
+
+def test_app_has_routes():
+    for package in REQUIRED_PACKAGES:
+        pytest.importorskip(package)
+    main = importlib.import_module("main")
+    paths = {route.path for route in main.app.routes}
+    assert "/api/v1/vector-store/search" in paths
+    assert "/api/v1/vector-store/search/batch" in paths
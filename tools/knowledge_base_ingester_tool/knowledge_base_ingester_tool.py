@@ -70,7 +70,10 @@ class KnowledgeBaseIngesterTool:
                     url=config.get('url'),
                     api_key=config.get('api_key'),
                     collection_name=collection_name,
-                    vector_size=3072  # text-embedding-3-large size
+                    vector_size=3072,  # text-embedding-3-large size
+                    prefer_grpc=config.get('prefer_grpc', False),
+                    grpc_port=config.get('grpc_port', 6334),
+                    timeout=config.get('timeout')
                 )
             except Exception as e:
                 print(f"Warning: Could not initialize Qdrant service: {e}")
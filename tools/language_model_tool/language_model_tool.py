@@ -4,7 +4,7 @@ Simple Language Model Tool - Uses existing language model services
 
 import sys
 import os
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple, Union
 
 # Add the parent directory to the path to import language model services
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
@@ -41,19 +41,19 @@ class LanguageModelTool:
         # Only add services that are available
         if OpenAIService:
             try:
-                self.services["openai"] = OpenAIService()
+                self.services["openai"] = OpenAIService.instance()
             except Exception as e:
                 print(f"Warning: Could not initialize OpenAI service: {e}")
         
         if GroqService:
             try:
-                self.services["groq"] = GroqService()
+                self.services["groq"] = GroqService.instance()
             except Exception as e:
                 print(f"Warning: Could not initialize Groq service: {e}")
         
         if OllamaService:
             try:
-                self.services["ollama"] = OllamaService()
+                self.services["ollama"] = OllamaService.instance()
             except Exception as e:
                 print(f"Warning: Could not initialize Ollama service: {e}")
         
@@ -82,67 +82,109 @@ class LanguageModelTool:
             Dictionary containing the response and metadata
         """
         try:
-            # Check if any services are available
-            if not self.services:
-                return {
-                    "success": False,
-                    "error": "No language model services available. Please install required packages (openai, groq, ollama).",
-                    "response": None
-                }
-            
-            # Validate service
-            if service not in self.services:
-                available_services = list(self.services.keys())
-                return {
-                    "success": False,
-                    "error": f"Service '{service}' not available. Available services: {available_services}",
-                    "response": None
-                }
-            
-            # Get the service
-            service_instance = self.services[service]
-            
-            # Get available models for this service
-            service_info = service_instance.get_models()
-            available_models = service_info["models"]
-            
-            # Select model
-            if model is None:
-                model = available_models[0]  # Use first available model
-            elif model not in available_models:
-                return {
-                    "success": False,
-                    "error": f"Model '{model}' not available for {service}. Available models: {available_models}",
-                    "response": None
-                }
-            
-            # Prepare the prompt with system message if provided
-            if system_prompt:
-                # Combine system prompt with user query
-                full_prompt = f"System: {system_prompt}\n\nUser: {query}"
-            else:
-                full_prompt = query
+            prepared = self._prepare_request(query, service, model, system_prompt)
+            if isinstance(prepared, dict):
+                return prepared
+            service_instance, model, full_prompt = prepared
             
             # Generate response
             response = service_instance.generate(model, full_prompt, **kwargs)
+            return self._success_result(query, service, model, response)
             
-            return {
-                "success": True,
-                "response": response,
-                "metadata": {
-                    "service": service,
-                    "model": model,
-                    "query_length": len(query),
-                    "response_length": len(response)
-                }
-            }
+        except Exception as e:
+            return self._error_result(str(e))
+    
+    async def agenerate_response(
+        self, 
+        query: str, 
+        service: str = "openai", 
+        model: Optional[str] = None,
+        system_prompt: Optional[str] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Async variant of generate_response() that awaits the service's agenerate().
+        
+        Args and return value are the same as generate_response().
+        """
+        try:
+            prepared = self._prepare_request(query, service, model, system_prompt)
+            if isinstance(prepared, dict):
+                return prepared
+            service_instance, model, full_prompt = prepared
+            
+            response = await service_instance.agenerate(model, full_prompt, **kwargs)
+            return self._success_result(query, service, model, response)
             
         except Exception as e:
-            return {
-                "success": False,
-                "error": str(e),
-                "response": None
+            return self._error_result(str(e))
+    
+    def _prepare_request(
+        self,
+        query: str,
+        service: str,
+        model: Optional[str],
+        system_prompt: Optional[str]
+    ) -> Union[Dict[str, Any], Tuple[Any, str, str]]:
+        """
+        Validate service and model and build the prompt.
+        
+        Returns:
+            (service_instance, model, full_prompt), or an error result dict
+        """
+        # Check if any services are available
+        if not self.services:
+            return self._error_result(
+                "No language model services available. Please install required packages (openai, groq, ollama)."
+            )
+        
+        # Validate service
+        if service not in self.services:
+            available_services = list(self.services.keys())
+            return self._error_result(f"Service '{service}' not available. Available services: {available_services}")
+        
+        # Get the service
+        service_instance = self.services[service]
+        
+        # Get available models for this service
+        service_info = service_instance.get_models()
+        available_models = service_info["models"]
+        
+        # Select model
+        if model is None:
+            model = available_models[0]  # Use first available model
+        elif model not in available_models:
+            return self._error_result(f"Model '{model}' not available for {service}. Available models: {available_models}")
+        
+        # Prepare the prompt with system message if provided
+        if system_prompt:
+            # Combine system prompt with user query
+            full_prompt = f"System: {system_prompt}\n\nUser: {query}"
+        else:
+            full_prompt = query
+        
+        return service_instance, model, full_prompt
+    
+    @staticmethod
+    def _success_result(query: str, service: str, model: str, response: str) -> Dict[str, Any]:
+        return {
+            "success": True,
+            "response": response,
+            "metadata": {
+                "service": service,
+                "model": model,
+                "query_length": len(query),
+                "response_length": len(response)
             }
+        }
+    
+    @staticmethod
+    def _error_result(error: str) -> Dict[str, Any]:
+        return {
+            "success": False,
+            "error": error,
+            "response": None
+        }
     
     def get_available_services(self) -> Dict[str, Any]:
         """
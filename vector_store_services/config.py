@@ -14,6 +14,10 @@ class VectorStoreConfig:
     # Qdrant Configuration
     QDRANT_URL = os.getenv('QDRANT_URL', 'localhost:6333')
     QDRANT_API_KEY = os.getenv('QDRANT_API_KEY', None)
+    # gRPC needs the Qdrant gRPC port (6334 by default) to be reachable
+    QDRANT_PREFER_GRPC = os.getenv('QDRANT_PREFER_GRPC', 'false').lower() in ('1', 'true', 'yes')
+    QDRANT_GRPC_PORT = int(os.getenv('QDRANT_GRPC_PORT', '6334'))
+    QDRANT_TIMEOUT = int(os.getenv('QDRANT_TIMEOUT', '30'))
     
     # Default Collection Settings
     DEFAULT_COLLECTION_NAME = os.getenv('DEFAULT_COLLECTION_NAME', 'default_collection')
@@ -27,6 +31,11 @@ class VectorStoreConfig:
     # Batch Settings
     DEFAULT_BATCH_SIZE = int(os.getenv('DEFAULT_BATCH_SIZE', '100'))
     
+    # Semantic Query Cache Settings (QUERY_CACHE_SIZE=0 disables the cache)
+    QUERY_CACHE_SIZE = int(os.getenv('QUERY_CACHE_SIZE', '0'))
+    QUERY_CACHE_THRESHOLD = float(os.getenv('QUERY_CACHE_THRESHOLD', '0.97'))
+    QUERY_CACHE_PLANES = int(os.getenv('QUERY_CACHE_PLANES', '10'))
+    
     @classmethod
     def get_qdrant_config(cls) -> Dict[str, Any]:
         """Get Qdrant configuration dictionary"""
@@ -34,7 +43,10 @@ class VectorStoreConfig:
             'url': cls.QDRANT_URL,
             'api_key': cls.QDRANT_API_KEY,
             'collection_name': cls.DEFAULT_COLLECTION_NAME,
-            'vector_size': cls.DEFAULT_VECTOR_SIZE
+            'vector_size': cls.DEFAULT_VECTOR_SIZE,
+            'prefer_grpc': cls.QDRANT_PREFER_GRPC,
+            'grpc_port': cls.QDRANT_GRPC_PORT,
+            'timeout': cls.QDRANT_TIMEOUT
         }
     
     @classmethod
@@ -44,3 +56,12 @@ class VectorStoreConfig:
             'limit': cls.DEFAULT_SEARCH_LIMIT,
             'score_threshold': cls.DEFAULT_SCORE_THRESHOLD
         }
+    
+    @classmethod
+    def get_query_cache_config(cls) -> Dict[str, Any]:
+        """Get semantic query cache configuration dictionary"""
+        return {
+            'max_entries': cls.QUERY_CACHE_SIZE,
+            'threshold': cls.QUERY_CACHE_THRESHOLD,
+            'num_planes': cls.QUERY_CACHE_PLANES
+        }
@@ -11,17 +11,19 @@ Supports basic operations like:
 
 import os
 import logging
-from typing import List, Dict, Any, Optional, Union, Tuple
+from typing import List, Dict, Any, Callable, Iterable, Optional, Union, Tuple
 from dataclasses import dataclass
+from itertools import islice
 import uuid
 from datetime import datetime
 
 try:
-    from qdrant_client import QdrantClient
+    from qdrant_client import QdrantClient, AsyncQdrantClient
     from qdrant_client.http import models
     from qdrant_client.http.models import Distance, VectorParams, PointStruct, Filter, FieldCondition, MatchValue
 except ImportError:
     QdrantClient = None
+    AsyncQdrantClient = None
     models = None
     Distance = None
     VectorParams = None
@@ -32,6 +34,10 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Quantization for collections created without an explicit choice, including the
+# ones created implicitly by the first write, so every collection is built the same way
+DEFAULT_QUANTIZATION = "int8"
+
 
 @dataclass
 class EmbeddingPayload:
@@ -61,11 +67,22 @@ class SearchResult:
 class QdrantService:
     """Service class for Qdrant vector database operations"""
     
+    # Connected sync clients shared by every service instance with the same
+    # connection settings, so per-collection services don't each open a client
+    _shared_clients: Dict[Tuple, Any] = {}
+    
+    # Callbacks run with the collection name after any instance writes to it
+    # (see add_write_listener)
+    _write_listeners: List[Callable[[str], None]] = []
+    
     def __init__(self, 
                  url: str = None, 
                  api_key: str = None,
                  collection_name: str = "default_collection",
-                 vector_size: int = 384):
+                 vector_size: int = 384,
+                 prefer_grpc: bool = False,
+                 grpc_port: int = 6334,
+                 timeout: Optional[int] = None):
         """
         Initialize Qdrant service
         
@@ -74,6 +91,9 @@ class QdrantService:
             api_key: API key for authentication (optional)
             collection_name: Default collection name
             vector_size: Vector dimension size
+            prefer_grpc: Talk to Qdrant over gRPC instead of REST
+            grpc_port: Qdrant gRPC port
+            timeout: Request timeout in seconds (client default if None)
         """
         if QdrantClient is None:
             raise ImportError("qdrant-client is not installed. Install it with: pip install qdrant-client")
@@ -82,47 +102,81 @@ class QdrantService:
         self.api_key = api_key or os.getenv('QDRANT_API_KEY')
         self.collection_name = collection_name
         self.vector_size = vector_size
+        self.prefer_grpc = prefer_grpc
+        self.grpc_port = grpc_port
+        self.timeout = timeout
         
-        # Initialize client
+        # Initialize client; the async one used by the FastAPI endpoints is created on first use
         self.client = self._initialize_client()
+        self._aclient = None
         
         logger.info(f"QdrantService initialized with URL: {self.url}")
     
+    @classmethod
+    def add_write_listener(cls, callback: Callable[[str], None]) -> None:
+        """
+        Register a callback invoked with the collection name after every upsert or
+        delete made through any QdrantService instance, e.g. to invalidate a search cache.
+        
+        Args:
+            callback: Called with the collection name; exceptions are logged and ignored
+        """
+        cls._write_listeners.append(callback)
+    
+    def _notify_write(self, collection_name: str) -> None:
+        """Tell the registered write listeners that a collection changed"""
+        for callback in self._write_listeners:
+            try:
+                callback(collection_name)
+            except Exception as e:
+                logger.error(f"Write listener failed for '{collection_name}': {e}")
+    
+    def _client_url(self) -> str:
+        """Normalize the configured URL into a full http(s) URL"""
+        # Handle different URL formats
+        if self.url.startswith('https://'):
+            # Already a full HTTPS URL (Qdrant Cloud)
+            return self.url
+        if self.url.startswith('http://'):
+            # HTTP URL (local or custom)
+            return self.url
+        # Just domain name - determine if it's cloud or local
+        if 'qdrant.tech' in self.url or 'qdrant.cloud' in self.url:
+            # Qdrant Cloud - add https://
+            return f"https://{self.url}"
+        # Local Qdrant - check if port already included
+        if ':6333' in self.url:
+            return f"http://{self.url}"
+        return f"http://{self.url}:6333"
+
+    def _client_kwargs(self) -> Dict[str, Any]:
+        """Connection settings shared by the sync and async clients"""
+        kwargs = {
+            'url': self._client_url(),
+            'prefer_grpc': self.prefer_grpc,
+            'grpc_port': self.grpc_port,
+            'timeout': self.timeout
+        }
+        if self.api_key:
+            # Use API key authentication (no key for local only)
+            kwargs['api_key'] = self.api_key
+        return kwargs
+
     def _initialize_client(self) -> QdrantClient:
-        """Initialize Qdrant client with proper configuration"""
+        """Initialize Qdrant client with proper configuration, reusing a connected one if available"""
         try:
-            # Handle different URL formats
-            if self.url.startswith('https://'):
-                # Already a full HTTPS URL (Qdrant Cloud)
-                clean_url = self.url
-            elif self.url.startswith('http://'):
-                # HTTP URL (local or custom)
-                clean_url = self.url
-            else:
-                # Just domain name - determine if it's cloud or local
-                if 'qdrant.tech' in self.url or 'qdrant.cloud' in self.url:
-                    # Qdrant Cloud - add https://
-                    clean_url = f"https://{self.url}"
-                else:
-                    # Local Qdrant - check if port already included
-                    if ':6333' in self.url:
-                        clean_url = f"http://{self.url}"
-                    else:
-                        clean_url = f"http://{self.url}:6333"
-            
-            if self.api_key:
-                # Use API key authentication
-                client = QdrantClient(
-                    url=clean_url,
-                    api_key=self.api_key
-                )
-            else:
-                # No API key (local only)
-                client = QdrantClient(url=clean_url)
+            kwargs = self._client_kwargs()
+            key = tuple(sorted(kwargs.items()))
+            client = self._shared_clients.get(key)
+            if client is not None:
+                return client
+            
+            client = QdrantClient(**kwargs)
             
             # Test connection
             client.get_collections()
-            logger.info(f"Successfully connected to Qdrant at {clean_url}")
+            logger.info(f"Successfully connected to Qdrant at {kwargs['url']}")
+            self._shared_clients[key] = client
             return client
             
         except Exception as e:
@@ -131,6 +185,21 @@ class QdrantService:
             logger.warning("Qdrant connection failed - service will be unavailable until connection is established")
             return None
     
+    @property
+    def aclient(self) -> Optional["AsyncQdrantClient"]:
+        """
+        Async Qdrant client, created on first use.
+
+        The connection is not probed here since this cannot await;
+        failures surface on the first request instead.
+        """
+        if self._aclient is None and AsyncQdrantClient is not None:
+            try:
+                self._aclient = AsyncQdrantClient(**self._client_kwargs())
+            except Exception as e:
+                logger.error(f"Failed to create async Qdrant client: {e}")
+        return self._aclient
+
     def _check_client(self) -> bool:
         """Check if client is available"""
         if self.client is None:
@@ -141,7 +210,8 @@ class QdrantService:
     def create_collection(self, 
                          collection_name: str = None, 
                          vector_size: int = None,
-                         distance: str = "Cosine") -> bool:
+                         distance: str = "Cosine",
+                         quantization: Optional[str] = None) -> bool:
         """
         Create a new collection
         
@@ -149,6 +219,7 @@ class QdrantService:
             collection_name: Name of the collection
             vector_size: Vector dimension size
             distance: Distance metric (Cosine, Dot, Euclid)
+            quantization: Optional vector quantization ("int8")
             
         Returns:
             bool: True if collection created successfully
@@ -174,7 +245,8 @@ class QdrantService:
                 vectors_config=VectorParams(
                     size=vector_size,
                     distance=getattr(Distance, distance.upper())
-                )
+                ),
+                quantization_config=self._quantization_config(quantization)
             )
             
             logger.info(f"Collection '{collection_name}' created successfully")
@@ -198,6 +270,7 @@ class QdrantService:
         
         try:
             self.client.delete_collection(collection_name)
+            self._notify_write(collection_name)
             logger.info(f"Collection '{collection_name}' deleted successfully")
             return True
             
@@ -237,7 +310,7 @@ class QdrantService:
         try:
             # Ensure collection exists
             if not self._collection_exists(collection_name):
-                self.create_collection(collection_name)
+                self.create_collection(collection_name, quantization=DEFAULT_QUANTIZATION)
             
             # Ensure ID is UUID format for Qdrant Cloud compatibility
             point_id = embedding_payload.id
@@ -245,21 +318,14 @@ class QdrantService:
                 point_id = str(uuid.uuid4())
                 logger.info(f"Converted string ID '{embedding_payload.id}' to UUID: {point_id}")
             
-            # Create point
-            point = PointStruct(
-                id=point_id,
-                vector=embedding_payload.vector,
-                payload={
-                    **embedding_payload.payload,
-                    **embedding_payload.metadata
-                }
-            )
+            point = self._build_point(embedding_payload, point_id)
             
             # Upsert point
             self.client.upsert(
                 collection_name=collection_name,
                 points=[point]
             )
+            self._notify_write(collection_name)
             
             logger.info(f"Embedding '{embedding_payload.id}' added to collection '{collection_name}'")
             return True
@@ -288,29 +354,19 @@ class QdrantService:
         try:
             # Ensure collection exists
             if not self._collection_exists(collection_name):
-                self.create_collection(collection_name)
+                self.create_collection(collection_name, quantization=DEFAULT_QUANTIZATION)
             
             # Process in batches
             for i in range(0, len(embedding_payloads), batch_size):
                 batch = embedding_payloads[i:i + batch_size]
-                points = []
-                
-                for payload in batch:
-                    point = PointStruct(
-                        id=payload.id,
-                        vector=payload.vector,
-                        payload={
-                            **payload.payload,
-                            **payload.metadata
-                        }
-                    )
-                    points.append(point)
+                points = [self._build_point(payload) for payload in batch]
                 
                 # Upsert batch
                 self.client.upsert(
                     collection_name=collection_name,
                     points=points
                 )
+                self._notify_write(collection_name)
                 
                 logger.info(f"Batch {i//batch_size + 1}: Added {len(points)} embeddings")
             
@@ -341,6 +397,7 @@ class QdrantService:
                 collection_name=collection_name,
                 points_selector=models.PointIdsList(points=[embedding_id])
             )
+            self._notify_write(collection_name)
             
             logger.info(f"Embedding '{embedding_id}' deleted from '{collection_name}'")
             return True
@@ -372,16 +429,7 @@ class QdrantService:
                 with_vectors=True
             )
             
-            if result:
-                point = result[0]
-                return EmbeddingPayload(
-                    id=point.id,
-                    vector=point.vector,
-                    payload=point.payload,
-                    metadata=point.payload
-                )
-            
-            return None
+            return self._to_embedding(result[0]) if result else None
             
         except Exception as e:
             logger.error(f"Failed to get embedding '{embedding_id}': {e}")
@@ -409,38 +457,17 @@ class QdrantService:
         collection_name = collection_name or self.collection_name
         
         try:
-            # Build filter if metadata_filter provided
-            search_filter = None
-            if metadata_filter:
-                conditions = []
-                for key, value in metadata_filter.items():
-                    conditions.append(
-                        FieldCondition(
-                            key=key,
-                            match=MatchValue(value=value)
-                        )
-                    )
-                search_filter = Filter(must=conditions)
-            
             # Perform search
             results = self.client.search(
                 collection_name=collection_name,
                 query_vector=query_vector,
                 limit=limit,
                 score_threshold=score_threshold,
-                query_filter=search_filter,
+                query_filter=self._build_filter(metadata_filter),
                 with_payload=True
             )
             
-            # Convert to SearchResult objects
-            search_results = []
-            for result in results:
-                search_results.append(SearchResult(
-                    id=result.id,
-                    score=result.score,
-                    payload=result.payload,
-                    metadata=result.payload
-                ))
+            search_results = self._to_search_results(results)
             
             logger.info(f"Found {len(search_results)} similar embeddings")
             return search_results
@@ -463,21 +490,103 @@ class QdrantService:
         
         try:
             info = self.client.get_collection(collection_name)
-            return {
-                'name': collection_name,
-                'vectors_count': info.vectors_count,
-                'indexed_vectors_count': info.indexed_vectors_count,
-                'points_count': info.points_count,
-                'segments_count': info.segments_count,
-                'config': {
-                    'vector_size': info.config.params.vectors.size,
-                    'distance': info.config.params.vectors.distance
-                }
-            }
+            return self._collection_info_to_dict(collection_name, info)
         except Exception as e:
             logger.error(f"Failed to get collection info for '{collection_name}': {e}")
             return None
     
+    @staticmethod
+    def _build_point(embedding_payload: EmbeddingPayload, point_id: Union[str, int] = None) -> PointStruct:
+        """Build a Qdrant point, merging payload and metadata"""
+        return PointStruct(
+            id=embedding_payload.id if point_id is None else point_id,
+            vector=embedding_payload.vector,
+            payload={
+                **embedding_payload.payload,
+                **embedding_payload.metadata
+            }
+        )
+
+    @staticmethod
+    def _build_filter(metadata_filter: Optional[Dict[str, Any]]) -> Optional[Filter]:
+        """Build an exact-match filter from metadata, or None if there is nothing to filter on"""
+        if not metadata_filter:
+            return None
+        return Filter(must=[
+            FieldCondition(key=key, match=MatchValue(value=value))
+            for key, value in metadata_filter.items()
+        ])
+
+    @staticmethod
+    def _quantization_config(quantization: Optional[str]) -> Optional[Any]:
+        """
+        Build a collection quantization config
+        
+        Args:
+            quantization: None for full-precision vectors, or "int8"
+            
+        Returns:
+            Quantization config for create_collection, or None
+        """
+        if quantization is None:
+            return None
+        if quantization.lower() != "int8":
+            raise ValueError(f"Unsupported quantization '{quantization}' (expected 'int8')")
+        return models.ScalarQuantization(
+            scalar=models.ScalarQuantizationConfig(
+                type=models.ScalarType.INT8,
+                quantile=0.99,
+                always_ram=True
+            )
+        )
+
+    @staticmethod
+    def _search_params(oversampling: Optional[float]) -> Optional[Any]:
+        """Search params that rescore oversampled quantized candidates with the original vectors"""
+        if oversampling is None:
+            return None
+        return models.SearchParams(
+            quantization=models.QuantizationSearchParams(rescore=True, oversampling=oversampling)
+        )
+
+    @staticmethod
+    def _to_embedding(point: Any) -> EmbeddingPayload:
+        """Convert a retrieved Qdrant record to an EmbeddingPayload"""
+        return EmbeddingPayload(
+            id=point.id,
+            vector=point.vector,
+            payload=point.payload,
+            metadata=point.payload
+        )
+
+    @staticmethod
+    def _to_search_results(results: List[Any]) -> List[SearchResult]:
+        """Convert scored Qdrant points to SearchResult objects"""
+        return [
+            SearchResult(
+                id=result.id,
+                score=result.score,
+                payload=result.payload,
+                metadata=result.payload
+            )
+            for result in results
+        ]
+
+    @staticmethod
+    def _collection_info_to_dict(collection_name: str, info: Any) -> Dict[str, Any]:
+        """Flatten a Qdrant collection description into a plain dict"""
+        return {
+            'name': collection_name,
+            'vectors_count': info.vectors_count,
+            'indexed_vectors_count': info.indexed_vectors_count,
+            'points_count': info.points_count,
+            'segments_count': info.segments_count,
+            'config': {
+                'vector_size': info.config.params.vectors.size,
+                'distance': info.config.params.vectors.distance
+            }
+        }
+
     def _collection_exists(self, collection_name: str) -> bool:
         """Check if collection exists"""
         try:
@@ -507,3 +616,378 @@ class QdrantService:
             return True
         except:
             return False
+
+    # Async counterparts backed by AsyncQdrantClient, used by the API endpoints
+    # so Qdrant round-trips don't block the event loop. They mirror the sync
+    # methods above, including returning False/None/[] on failure.
+
+    def _check_aclient(self) -> bool:
+        """Check if the async client is available"""
+        if self.aclient is None:
+            logger.error("Async Qdrant client is not available")
+            return False
+        return True
+
+    async def ahealth_check(self) -> bool:
+        """Check if Qdrant service is healthy"""
+        if self.aclient is None:
+            return False
+        try:
+            await self.aclient.get_collections()
+            return True
+        except Exception:
+            return False
+
+    async def alist_collections(self) -> List[str]:
+        """
+        List all collections
+        
+        Returns:
+            List[str]: List of collection names
+        """
+        if not self._check_aclient():
+            return []
+        try:
+            collections = await self.aclient.get_collections()
+            return [col.name for col in collections.collections]
+        except Exception as e:
+            logger.error(f"Failed to list collections: {e}")
+            return []
+
+    async def _acollection_exists(self, collection_name: str) -> bool:
+        """Check if collection exists"""
+        try:
+            return await self.aclient.collection_exists(collection_name)
+        except Exception:
+            return False
+
+    async def acreate_collection(self, 
+                                 collection_name: str = None, 
+                                 vector_size: int = None,
+                                 distance: str = "Cosine",
+                                 quantization: Optional[str] = None) -> bool:
+        """
+        Create a new collection
+        
+        Args:
+            collection_name: Name of the collection
+            vector_size: Vector dimension size
+            distance: Distance metric (Cosine, Dot, Euclid)
+            quantization: Optional vector quantization ("int8")
+            
+        Returns:
+            bool: True if collection created successfully
+        """
+        if not self._check_aclient():
+            return False
+            
+        collection_name = collection_name or self.collection_name
+        vector_size = vector_size or self.vector_size
+        
+        try:
+            if await self._acollection_exists(collection_name):
+                logger.warning(f"Collection '{collection_name}' already exists")
+                return True
+            
+            await self.aclient.create_collection(
+                collection_name=collection_name,
+                vectors_config=VectorParams(
+                    size=vector_size,
+                    distance=getattr(Distance, distance.upper())
+                ),
+                quantization_config=self._quantization_config(quantization)
+            )
+            
+            logger.info(f"Collection '{collection_name}' created successfully")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to create collection '{collection_name}': {e}")
+            return False
+
+    async def adelete_collection(self, collection_name: str = None) -> bool:
+        """
+        Delete a collection
+        
+        Args:
+            collection_name: Name of the collection to delete
+            
+        Returns:
+            bool: True if collection deleted successfully
+        """
+        if not self._check_aclient():
+            return False
+        collection_name = collection_name or self.collection_name
+        
+        try:
+            await self.aclient.delete_collection(collection_name)
+            self._notify_write(collection_name)
+            logger.info(f"Collection '{collection_name}' deleted successfully")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to delete collection '{collection_name}': {e}")
+            return False
+
+    async def aget_collection_info(self, collection_name: str = None) -> Optional[Dict[str, Any]]:
+        """
+        Get collection information
+        
+        Args:
+            collection_name: Target collection name
+            
+        Returns:
+            Dict with collection info or None if not found
+        """
+        if not self._check_aclient():
+            return None
+        collection_name = collection_name or self.collection_name
+        
+        try:
+            info = await self.aclient.get_collection(collection_name)
+            return self._collection_info_to_dict(collection_name, info)
+        except Exception as e:
+            logger.error(f"Failed to get collection info for '{collection_name}': {e}")
+            return None
+
+    async def aadd_embedding(self, 
+                             embedding_payload: EmbeddingPayload,
+                             collection_name: str = None) -> bool:
+        """
+        Add a single embedding to the collection
+        
+        Args:
+            embedding_payload: EmbeddingPayload object with vector and metadata
+            collection_name: Target collection name
+            
+        Returns:
+            bool: True if embedding added successfully
+        """
+        if not self._check_aclient():
+            return False
+        collection_name = collection_name or self.collection_name
+        
+        try:
+            if not await self._acollection_exists(collection_name):
+                await self.acreate_collection(collection_name, quantization=DEFAULT_QUANTIZATION)
+            
+            # Ensure ID is UUID format for Qdrant Cloud compatibility
+            point_id = embedding_payload.id
+            if not self._is_valid_uuid(point_id):
+                point_id = str(uuid.uuid4())
+                logger.info(f"Converted string ID '{embedding_payload.id}' to UUID: {point_id}")
+            
+            await self.aclient.upsert(
+                collection_name=collection_name,
+                points=[self._build_point(embedding_payload, point_id)]
+            )
+            self._notify_write(collection_name)
+            
+            logger.info(f"Embedding '{embedding_payload.id}' added to collection '{collection_name}'")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to add embedding '{embedding_payload.id}': {e}")
+            return False
+
+    async def aadd_embeddings_batch(self, 
+                                    embedding_payloads: Iterable[EmbeddingPayload],
+                                    collection_name: str = None,
+                                    batch_size: int = 100) -> bool:
+        """
+        Add multiple embeddings in batches
+        
+        Args:
+            embedding_payloads: EmbeddingPayload objects; may be a generator, in which
+                case only one batch is materialized at a time
+            collection_name: Target collection name
+            batch_size: Number of embeddings per batch
+            
+        Returns:
+            bool: True if all embeddings added successfully
+        """
+        if not self._check_aclient():
+            return False
+        collection_name = collection_name or self.collection_name
+        
+        try:
+            if not await self._acollection_exists(collection_name):
+                await self.acreate_collection(collection_name, quantization=DEFAULT_QUANTIZATION)
+            
+            payloads = iter(embedding_payloads)
+            total = 0
+            batch_number = 0
+            while True:
+                points = [self._build_point(payload) for payload in islice(payloads, batch_size)]
+                if not points:
+                    break
+                await self.aclient.upsert(
+                    collection_name=collection_name,
+                    points=points
+                )
+                self._notify_write(collection_name)
+                total += len(points)
+                batch_number += 1
+                logger.info(f"Batch {batch_number}: Added {len(points)} embeddings")
+            
+            logger.info(f"Successfully added {total} embeddings to '{collection_name}'")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to add embeddings batch: {e}")
+            return False
+
+    async def adelete_embedding(self, 
+                                embedding_id: str,
+                                collection_name: str = None) -> bool:
+        """
+        Delete an embedding by ID
+        
+        Args:
+            embedding_id: ID of the embedding to delete
+            collection_name: Target collection name
+            
+        Returns:
+            bool: True if embedding deleted successfully
+        """
+        if not self._check_aclient():
+            return False
+        collection_name = collection_name or self.collection_name
+        
+        try:
+            await self.aclient.delete(
+                collection_name=collection_name,
+                points_selector=models.PointIdsList(points=[embedding_id])
+            )
+            self._notify_write(collection_name)
+            
+            logger.info(f"Embedding '{embedding_id}' deleted from '{collection_name}'")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to delete embedding '{embedding_id}': {e}")
+            return False
+
+    async def aget_embedding(self, 
+                             embedding_id: str,
+                             collection_name: str = None) -> Optional[EmbeddingPayload]:
+        """
+        Get an embedding by ID
+        
+        Args:
+            embedding_id: ID of the embedding to retrieve
+            collection_name: Target collection name
+            
+        Returns:
+            EmbeddingPayload or None if not found
+        """
+        if not self._check_aclient():
+            return None
+        collection_name = collection_name or self.collection_name
+        
+        try:
+            result = await self.aclient.retrieve(
+                collection_name=collection_name,
+                ids=[embedding_id],
+                with_payload=True,
+                with_vectors=True
+            )
+            return self._to_embedding(result[0]) if result else None
+            
+        except Exception as e:
+            logger.error(f"Failed to get embedding '{embedding_id}': {e}")
+            return None
+
+    async def asearch_similar(self, 
+                              query_vector: List[float],
+                              collection_name: str = None,
+                              limit: int = 10,
+                              score_threshold: float = 0.0,
+                              metadata_filter: Optional[Dict[str, Any]] = None,
+                              oversampling: Optional[float] = None) -> List[SearchResult]:
+        """
+        Search for similar embeddings
+        
+        Args:
+            query_vector: Query vector for similarity search
+            collection_name: Target collection name
+            limit: Maximum number of results
+            score_threshold: Minimum similarity score
+            metadata_filter: Optional metadata filter
+            oversampling: On quantized collections, fetch limit * oversampling
+                candidates and rescore them with the original vectors
+            
+        Returns:
+            List[SearchResult]: List of similar embeddings
+        """
+        if not self._check_aclient():
+            return []
+        collection_name = collection_name or self.collection_name
+        
+        try:
+            # query_points rather than search, which newer AsyncQdrantClient releases no longer have
+            response = await self.aclient.query_points(
+                collection_name=collection_name,
+                query=query_vector,
+                limit=limit,
+                score_threshold=score_threshold,
+                query_filter=self._build_filter(metadata_filter),
+                search_params=self._search_params(oversampling),
+                with_payload=True
+            )
+            
+            search_results = self._to_search_results(response.points)
+            logger.info(f"Found {len(search_results)} similar embeddings")
+            return search_results
+            
+        except Exception as e:
+            logger.error(f"Failed to search similar embeddings: {e}")
+            return []
+
+    async def asearch_similar_batch(self,
+                                    queries: List[Dict[str, Any]],
+                                    collection_name: str = None,
+                                    batch_size: int = 64) -> List[List[SearchResult]]:
+        """
+        Run several similarity searches against one collection with batched requests
+        
+        Args:
+            queries: Dicts with query_vector and optional limit, score_threshold,
+                metadata_filter and oversampling (same meaning as in asearch_similar)
+            collection_name: Target collection name
+            batch_size: Maximum number of queries sent per request
+            
+        Returns:
+            List[List[SearchResult]]: Results for each query, in input order
+        """
+        if not self._check_aclient():
+            return [[] for _ in queries]
+        collection_name = collection_name or self.collection_name
+        
+        try:
+            results: List[List[SearchResult]] = []
+            # Server-side parallelism per batch is bounded, so keep batches small
+            for i in range(0, len(queries), batch_size):
+                requests = [
+                    models.QueryRequest(
+                        query=query["query_vector"],
+                        limit=query.get("limit", 10),
+                        score_threshold=query.get("score_threshold", 0.0),
+                        filter=self._build_filter(query.get("metadata_filter")),
+                        params=self._search_params(query.get("oversampling")),
+                        with_payload=True
+                    )
+                    for query in queries[i:i + batch_size]
+                ]
+                responses = await self.aclient.query_batch_points(
+                    collection_name=collection_name,
+                    requests=requests
+                )
+                results.extend(self._to_search_results(response.points) for response in responses)
+            
+            logger.info(f"Ran {len(queries)} batched searches on '{collection_name}'")
+            return results
+            
+        except Exception as e:
+            logger.error(f"Failed to run batched search: {e}")
+            return [[] for _ in queries]
@@ -0,0 +1,181 @@
+"""
+Semantic Query Cache
+
+This module provides an in-process cache for similarity search results.
+Query vectors are bucketed with random-projection LSH; a lookup returns the
+cached results of a previous query in the same bucket whose cosine similarity
+to the new query is at least the configured threshold.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class QueryCache:
+    """Bounded LRU cache of search results keyed by LSH bucket of the query vector"""
+
+    def __init__(self,
+                 max_entries: int = 1024,
+                 threshold: float = 0.97,
+                 num_planes: int = 10,
+                 seed: int = 0):
+        """
+        Initialize the query cache
+
+        Args:
+            max_entries: Maximum number of cached queries (0 disables the cache)
+            threshold: Minimum cosine similarity for a cached query to be reused
+            num_planes: Number of LSH hyperplanes, i.e. bits per bucket key
+            seed: Seed for hyperplane generation
+        """
+        self.max_entries = max_entries
+        self.threshold = threshold
+        self.num_planes = num_planes
+        self._rng = np.random.default_rng(seed)
+        # Hyperplanes per vector dimension, generated on first use
+        self._planes: Dict[int, np.ndarray] = {}
+        # (scope, bucket) -> (stacked unit vectors, results per vector), least recently used first
+        self._buckets: "OrderedDict[Tuple[Hashable, bytes], Tuple[np.ndarray, List[Any]]]" = OrderedDict()
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+        # Bumped by invalidate(), per collection and globally, so results computed
+        # before a write are not stored after it (see token())
+        self._generations: Dict[Hashable, int] = {}
+        self._global_generation = 0
+        # Writes made through the service layer invalidate from worker threads
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def _normalize(self, vector: List[float]) -> Optional[np.ndarray]:
+        """Return the query as a unit float32 vector, or None if it has zero length"""
+        unit = np.asarray(vector, dtype=np.float32)
+        norm = float(np.linalg.norm(unit))
+        if unit.ndim != 1 or norm == 0.0:
+            return None
+        return unit / norm
+
+    def _bucket(self, unit: np.ndarray) -> bytes:
+        """LSH bucket key: which side of each hyperplane the vector falls on"""
+        planes = self._planes.get(unit.shape[0])
+        if planes is None:
+            planes = self._rng.standard_normal((self.num_planes, unit.shape[0])).astype(np.float32)
+            self._planes[unit.shape[0]] = planes
+        return np.packbits(planes @ unit > 0).tobytes()
+
+    def get(self, scope: Hashable, vector: List[float]) -> Optional[List[Any]]:
+        """
+        Look up cached results for a query
+
+        Args:
+            scope: Hashable key for everything besides the vector that affects the
+                results (collection, limit, filters, ...)
+            vector: Query vector
+
+        Returns:
+            Cached results, or None on a miss
+        """
+        if not self.enabled:
+            return None
+        unit = self._normalize(vector)
+        if unit is None:
+            return None
+        with self._lock:
+            key = (scope, self._bucket(unit))
+            entry = self._buckets.get(key)
+            if entry is not None:
+                vectors, results = entry
+                similarities = vectors @ unit
+                best = int(np.argmax(similarities))
+                if similarities[best] >= self.threshold:
+                    self._buckets.move_to_end(key)
+                    self.hits += 1
+                    return results[best]
+            self.misses += 1
+            return None
+
+    def token(self, scope: Hashable) -> Tuple[int, int]:
+        """
+        Snapshot of the invalidation state for a scope, taken before running a search
+        whose results will be passed to put()
+
+        Args:
+            scope: Same scope key as passed to get()/put()
+
+        Returns:
+            Opaque token for put()
+        """
+        with self._lock:
+            return self._global_generation, self._generations.get(scope[0], 0)
+
+    def put(self, scope: Hashable, vector: List[float], results: List[Any],
+            token: Optional[Tuple[int, int]] = None) -> None:
+        """
+        Store results for a query, evicting least recently used buckets when full
+
+        Args:
+            scope: Same scope key as passed to get()
+            vector: Query vector
+            results: Search results to cache
+            token: token(scope) taken before the search; the results are dropped if
+                the collection was invalidated since
+        """
+        if not self.enabled:
+            return
+        unit = self._normalize(vector)
+        if unit is None:
+            return
+        with self._lock:
+            if token is not None and token != (self._global_generation, self._generations.get(scope[0], 0)):
+                return
+            key = (scope, self._bucket(unit))
+            entry = self._buckets.get(key)
+            if entry is None:
+                self._buckets[key] = (unit[np.newaxis, :], [results])
+            else:
+                vectors, cached_results = entry
+                self._buckets[key] = (np.vstack((vectors, unit)), cached_results + [results])
+                self._buckets.move_to_end(key)
+            self._size += 1
+            while self._size > self.max_entries:
+                _, (_, evicted) = self._buckets.popitem(last=False)
+                self._size -= len(evicted)
+
+    def invalidate(self, collection_name: Optional[str] = None) -> None:
+        """
+        Drop cached results
+
+        Args:
+            collection_name: Only drop entries whose scope starts with this
+                collection name; drops everything if None
+        """
+        with self._lock:
+            if collection_name is None:
+                self._global_generation += 1
+                self._buckets.clear()
+                self._size = 0
+                return
+            self._generations[collection_name] = self._generations.get(collection_name, 0) + 1
+            for key in [key for key in self._buckets if key[0][0] == collection_name]:
+                self._size -= len(self._buckets.pop(key)[1])
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current size"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "entries": self._size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }